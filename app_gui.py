@@ -3,35 +3,41 @@
 import os
 import sys
 import threading
+import subprocess
+import collections
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from functools import partial
+import importlib.util
+import json
 import re
 
-from main import AIClipper
+# Heavy imports (main.AIClipper pulls in Whisper/torch transitively) are
+# deferred to the worker thread in _init_clipper_bg
 
+# Precompiled at import time so the Download handler doesn't re-parse the
+# pattern on every click
+_YOUTUBE_RE = re.compile(
+    r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/(watch\?v=|embed/|v/|.+\?v=)?([^&=%\?]{11})'
+)
 
-class ModernButton(tk.Button):
-    """Custom modern button with hover effect."""
-    
-    def __init__(self, parent, **kwargs):
-        super().__init__(parent, **kwargs)
-        self.defaultBackground = self["background"]
-        self.bind("<Enter>", self.on_enter)
-        self.bind("<Leave>", self.on_leave)
-    
-    def on_enter(self, e):
-        if self['state'] != 'disabled':
-            self['background'] = self['activebackground']
-    
-    def on_leave(self, e):
-        self['background'] = self.defaultBackground
+
+@dataclass
+class ProcessingRequest:
+    """Settings snapshot handed to the processing worker thread."""
+    video: str
+    model: str
+    top_n: int
 
 
 class AIClipperModernGUI:
     """AI Clipper Modern Desktop Application."""
-    
+
+    MAX_LOG_LINES = 2000
+
     def __init__(self, root):
         self.root = root
         self.root.title("AI Clipper Pro")
@@ -50,13 +56,39 @@ class AIClipperModernGUI:
         self.is_processing = False
         self.clipper = None
         self.result = None
-        
+        self._last_pct = -1
+        self._last_status = None
+        self._pending_progress = None
+        self._drain_after_id = None
+        self._ts_sec = 0
+        self._ts_str = ""
+        self._pending_confirm = False
+
+        # Persisted GUI state (last-used browse directory)
+        self._state_path = Path.home() / ".ai_clipper_state.json"
+        self._last_dir = self._load_state().get('last_dir')
+
+        # Created once at startup instead of per download
+        self.downloads_dir = Path("./downloads").resolve()
+        self.downloads_dir.mkdir(parents=True, exist_ok=True)
+
+        # Log lines are queued by worker threads and drained on the UI thread
+        # in one batch per tick instead of one Tk callback per line
+        self._log_queue = collections.deque()
+        self._log_lock = threading.Lock()
+
         # Setup UI
         self._setup_ui()
         self._center_window()
-        
-        # Initialize AIClipper
-        self._init_clipper()
+
+        # Start the log pump; flush immediately when the window is restored
+        self._drain_after_id = self.root.after(100, self._drain_log)
+        self.root.bind('<Map>', self._on_map)
+
+        # Initialize AIClipper on a worker thread so the window paints
+        # immediately instead of waiting for model/config loading
+        self.process_btn.config(state=tk.DISABLED, text="⏳ Loading models...")
+        threading.Thread(target=self._init_clipper_bg, daemon=True).start()
     
     def setup_styles(self):
         """Setup modern styles."""
@@ -86,17 +118,54 @@ class AIClipperModernGUI:
             lightcolor=self.colors['primary'],
             darkcolor=self.colors['primary']
         )
+
+        # Button styles: hover handled by the style map inside Tcl/Tk,
+        # no per-widget <Enter>/<Leave> Python callbacks needed
+        button_styles = [
+            ("Primary.TButton", self.colors['primary'], self.colors['primary_hover'],
+             ("Segoe UI", 10, "bold"), (20, 10)),
+            ("Danger.TButton", self.colors['danger'], '#E63946',
+             ("Segoe UI", 10, "bold"), (20, 10)),
+            ("Success.TButton", self.colors['success'], '#00B386',
+             ("Segoe UI", 16, "bold"), (60, 20)),
+            ("Warning.TButton", self.colors['warning'], '#E59400',
+             ("Segoe UI", 16, "bold"), (60, 20)),
+            ("Output.TButton", self.colors['primary'], self.colors['primary_hover'],
+             ("Segoe UI", 11, "bold"), (30, 12)),
+        ]
+        for name, normal, hover, font, padding in button_styles:
+            style.configure(
+                name,
+                background=normal,
+                foreground=self.colors['light'],
+                bordercolor=normal,
+                focuscolor=normal,
+                borderwidth=0,
+                font=font,
+                padding=padding
+            )
+            style.map(
+                name,
+                background=[("disabled", self.colors['gray']), ("active", hover)],
+                foreground=[("disabled", "#8888AA")]
+            )
     
-    def _init_clipper(self):
-        """Initialize AI Clipper."""
+    def _init_clipper_bg(self):
+        """Initialize AI Clipper on a background thread."""
         try:
             self.log_message("⚡ Initializing AI Clipper...", "info")
+            from main import AIClipper
             self.clipper = AIClipper(config_path="config.yaml")
             self.log_message("✓ AI Clipper ready!", "success")
-            self.status_text.set("Ready to create viral clips")
+
+            def _ready():
+                self.status_text.set("Ready to create viral clips")
+                self.process_btn.config(state=tk.NORMAL, text="🚀 START PROCESSING")
+
+            self.root.after(0, _ready)
         except Exception as e:
             self.log_message(f"✗ Error: {e}", "error")
-            messagebox.showerror("Error", str(e))
+            self.root.after(0, partial(messagebox.showerror, "Error", str(e)))
     
     def _setup_ui(self):
         """Setup modern user interface."""
@@ -218,18 +287,12 @@ class AIClipperModernGUI:
         )
         self.video_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=10, padx=(0, 10))
         
-        self.browse_btn = ModernButton(
+        self.browse_btn = ttk.Button(
             file_input_frame,
             text="📂 Browse",
             command=self._browse_video,
-            bg=self.colors['primary'],
-            fg=self.colors['light'],
-            font=("Segoe UI", 10, "bold"),
-            padx=20,
-            pady=10,
-            cursor="hand2",
-            relief=tk.FLAT,
-            activebackground=self.colors['primary_hover']
+            style="Primary.TButton",
+            cursor="hand2"
         )
         self.browse_btn.pack(side=tk.RIGHT)
         
@@ -261,18 +324,12 @@ class AIClipperModernGUI:
         self.youtube_entry.bind("<FocusIn>", self._clear_youtube_placeholder)
         self.youtube_entry.bind("<FocusOut>", self._restore_youtube_placeholder)
         
-        self.download_btn = ModernButton(
+        self.download_btn = ttk.Button(
             youtube_input_frame,
             text="⬇️ Download",
             command=self._download_youtube,
-            bg=self.colors['danger'],
-            fg=self.colors['light'],
-            font=("Segoe UI", 10, "bold"),
-            padx=20,
-            pady=10,
-            cursor="hand2",
-            relief=tk.FLAT,
-            activebackground='#E63946'
+            style="Danger.TButton",
+            cursor="hand2"
         )
         self.download_btn.pack(side=tk.RIGHT)
         
@@ -286,9 +343,10 @@ class AIClipperModernGUI:
         )
         self.youtube_info.pack(anchor=tk.W, pady=(8, 0))
         
-        # Separator
-        ttk.Separator(left_panel, orient='horizontal').pack(fill=tk.X, padx=25, pady=15)
-        
+        # Separator (anchor for toggling the input sections above it)
+        self._toggle_anchor = ttk.Separator(left_panel, orient='horizontal')
+        self._toggle_anchor.pack(fill=tk.X, padx=25, pady=15)
+
         # Settings Section
         settings_frame = tk.Frame(left_panel, bg=self.colors['darker'], padx=25, pady=15)
         settings_frame.pack(fill=tk.X)
@@ -361,18 +419,12 @@ class AIClipperModernGUI:
         button_container = tk.Frame(left_panel, bg=self.colors['darker'], pady=30)
         button_container.pack(fill=tk.X, side=tk.BOTTOM)
         
-        self.process_btn = ModernButton(
+        self.process_btn = ttk.Button(
             button_container,
             text="🚀 START PROCESSING",
             command=self._start_processing,
-            bg=self.colors['success'],
-            fg=self.colors['light'],
-            font=("Segoe UI", 16, "bold"),
-            padx=60,
-            pady=20,
-            cursor="hand2",
-            relief=tk.FLAT,
-            activebackground='#00B386'
+            style="Success.TButton",
+            cursor="hand2"
         )
         self.process_btn.pack(expand=True)
         
@@ -434,9 +486,13 @@ class AIClipperModernGUI:
             fg=self.colors['light']
         ).pack(anchor=tk.W, pady=(0, 10))
         
-        # Log text with custom colors
-        self.log_text = scrolledtext.ScrolledText(
-            log_frame,
+        # Log text with custom colors (plain Text + scrollbar; the buffer is
+        # capped in _drain_log so redraw cost stays bounded on long runs)
+        log_text_frame = tk.Frame(log_frame, bg=self.colors['darker'])
+        log_text_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.log_text = tk.Text(
+            log_text_frame,
             height=20,
             font=("Consolas", 9),
             bg=self.colors['bg_card'],
@@ -444,9 +500,13 @@ class AIClipperModernGUI:
             wrap=tk.WORD,
             relief=tk.FLAT,
             padx=10,
-            pady=10
+            pady=10,
+            undo=False
         )
-        self.log_text.pack(fill=tk.BOTH, expand=True)
+        log_scrollbar = ttk.Scrollbar(log_text_frame, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Configure log tags for colors
         self.log_text.tag_config("info", foreground="#00D9A3")
@@ -455,46 +515,39 @@ class AIClipperModernGUI:
         self.log_text.tag_config("warning", foreground="#FFA502")
         
         # Open Output Button
-        self.open_output_btn = ModernButton(
+        self.open_output_btn = ttk.Button(
             log_frame,
             text="📁 Open Output Folder",
             command=self._open_output_folder,
-            bg=self.colors['primary'],
-            fg=self.colors['light'],
-            font=("Segoe UI", 11, "bold"),
-            padx=30,
-            pady=12,
+            style="Output.TButton",
             cursor="hand2",
-            relief=tk.FLAT,
-            state=tk.DISABLED,
-            activebackground=self.colors['primary_hover']
+            state=tk.DISABLED
         )
         self.open_output_btn.pack(fill=tk.X, pady=(15, 0))
         
+        # Buttons toggled together by _set_busy
+        self._busy_buttons = [
+            self.process_btn,
+            self.browse_btn,
+            self.download_btn,
+            self.open_output_btn
+        ]
+
         # Initial input type
         self._toggle_input_type()
     
     def _toggle_input_type(self):
-        try:
-            parent = self.file_section.master
-            children = parent.winfo_children()
-
-            # Cek apakah ada cukup children untuk pakai 'before'
-            if len(children) > 3:
-                target_widget = children[3]
-                # Pastikan target_widget sudah dipack
-                if str(target_widget) in parent.pack_slaves():
-                    self.file_section.pack(fill=tk.X, before=target_widget)
-                else:
-                    self.file_section.pack(fill=tk.X)
-            else:
-                self.file_section.pack(fill=tk.X)
+        """Show the section for the selected input type."""
+        self.file_section.pack_forget()
+        self.youtube_section.pack_forget()
+
+        if self.input_type.get() == "file":
+            target = self.file_section
+        else:
+            target = self.youtube_section
+        target.pack(fill=tk.X, before=self._toggle_anchor)
 
-        except Exception as e:
-            print("Error packing file_section, packing normally:", e)
-            self.file_section.pack(fill=tk.X)
 
-    
     def _clear_youtube_placeholder(self, event):
         """Clear YouTube placeholder."""
         if self.youtube_entry.get() == "https://youtube.com/watch?v=...":
@@ -508,12 +561,13 @@ class AIClipperModernGUI:
             self.youtube_entry.config(fg=self.colors['gray'])
     
     def _center_window(self):
-        """Center window on screen."""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        """Center window on screen without forcing a layout flush."""
+        # Use the fixed size requested in __init__ instead of calling
+        # update_idletasks(), which would synchronously process every
+        # pending pack() from _setup_ui before first paint
+        width, height = 1100, 800
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def _browse_video(self):
@@ -524,15 +578,34 @@ class AIClipperModernGUI:
         
         filename = filedialog.askopenfilename(
             title="Select Video File",
+            initialdir=self._last_dir or str(Path.home()),
             filetypes=[
                 ("Video Files", "*.mp4 *.mov *.avi *.mkv *.webm"),
                 ("All Files", "*.*")
             ]
         )
-        
+
         if filename:
             self.video_path.set(filename)
+            self._last_dir = str(Path(filename).parent)
+            self._save_state({'last_dir': self._last_dir})
             self.log_message(f"✓ Selected: {Path(filename).name}", "success")
+
+    def _load_state(self):
+        """Load persisted GUI state (best-effort)."""
+        try:
+            return json.loads(self._state_path.read_text(encoding='utf-8'))
+        except Exception:
+            return {}
+
+    def _save_state(self, state):
+        """Atomically persist GUI state (best-effort)."""
+        try:
+            tmp_path = self._state_path.with_suffix('.json.tmp')
+            tmp_path.write_text(json.dumps(state), encoding='utf-8')
+            tmp_path.replace(self._state_path)
+        except Exception:
+            pass
     
     def _download_youtube(self):
         """Download YouTube video."""
@@ -548,22 +621,20 @@ class AIClipperModernGUI:
             return
         
         # Validate YouTube URL format
-        youtube_regex = r'(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/(watch\?v=|embed/|v/|.+\?v=)?([^&=%\?]{11})'
-        if not re.match(youtube_regex, url):
+        if not _YOUTUBE_RE.match(url):
             messagebox.showerror("Invalid URL", "Please enter a valid YouTube URL")
             return
         
-        # Check if yt-dlp is installed
-        try:
-            import yt_dlp
-        except ImportError:
+        # Check if yt-dlp is installed (without executing the module)
+        if importlib.util.find_spec("yt_dlp") is None:
             if messagebox.askyesno(
                 "Missing Dependency",
                 "yt-dlp is required to download YouTube videos.\n\nInstall it now?\n\nCommand: pip install yt-dlp"
             ):
                 self.log_message("Installing yt-dlp...", "info")
-                os.system("pip install yt-dlp")
-                messagebox.showinfo("Installation", "Please restart the application after installation")
+                self.download_btn.config(state=tk.DISABLED, text="⏳ Installing...")
+                thread = threading.Thread(target=self._install_ytdlp_thread, daemon=True)
+                thread.start()
             return
         
         # Download in thread
@@ -573,21 +644,51 @@ class AIClipperModernGUI:
         thread = threading.Thread(target=self._download_youtube_thread, args=(url,), daemon=True)
         thread.start()
     
+    def _install_ytdlp_thread(self):
+        """Install yt-dlp in background, streaming pip output to the log."""
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "pip", "install", "yt-dlp"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    self.log_message(line, "info")
+            proc.wait()
+
+            if proc.returncode == 0:
+                self.log_message("✓ yt-dlp installed!", "success")
+            else:
+                self.log_message(f"✗ pip exited with code {proc.returncode}", "error")
+
+        except Exception as e:
+            self.log_message(f"✗ Installation failed: {e}", "error")
+
+        finally:
+            self.root.after(0, partial(
+                self.download_btn.config, state=tk.NORMAL, text="⬇️ Download"
+            ))
+
     def _download_youtube_thread(self, url):
         """Download YouTube video in background."""
         try:
             import yt_dlp
-            
-            # Create downloads folder
-            download_dir = "./downloads"
-            os.makedirs(download_dir, exist_ok=True)
-            
-            # Download options
+
+            # Download options: parallel fragment fetches for DASH/HLS
+            # sources, pre-merged mp4, truncated titles for cheap path ops
             ydl_opts = {
-                'format': 'best[ext=mp4]',
-                'outtmpl': os.path.join(download_dir, '%(title)s.%(ext)s'),
+                'format': 'bv*[ext=mp4]+ba[ext=m4a]/b[ext=mp4]/best',
+                'outtmpl': str(self.downloads_dir / '%(title).80s.%(ext)s'),
                 'quiet': True,
-                'no_warnings': True
+                'no_warnings': True,
+                'concurrent_fragment_downloads': 8,
+                'http_chunk_size': 10 * 1024 * 1024,
+                'retries': 3,
+                'fragment_retries': 3,
+                'merge_output_format': 'mp4',
             }
             
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -601,69 +702,107 @@ class AIClipperModernGUI:
             messagebox.showinfo("Success", f"Video downloaded successfully!\n\n{Path(filename).name}")
             
             # Switch to file mode
-            self.root.after(0, lambda: self.input_type.set("file"))
+            self.root.after(0, self.input_type.set, "file")
             self.root.after(0, self._toggle_input_type)
-            
+
         except Exception as e:
             self.log_message(f"✗ Download failed: {e}", "error")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to download video:\n\n{str(e)}"))
-        
+            self.root.after(0, partial(
+                messagebox.showerror, "Error", f"Failed to download video:\n\n{str(e)}"
+            ))
+
         finally:
-            self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL, text="⬇️ Download"))
+            self.root.after(0, partial(
+                self.download_btn.config, state=tk.NORMAL, text="⬇️ Download"
+            ))
     
     def _start_processing(self):
         """Start video processing."""
         if self.is_processing:
             messagebox.showwarning("Processing", "Already processing a video")
             return
-        
-        # Check input
-        if self.input_type.get() == "file":
-            if not self.video_path.get():
+
+        if self.clipper is None:
+            messagebox.showwarning("Loading", "AI Clipper is still loading, please wait")
+            return
+
+        # Check input (read each Tk variable once — every .get() is a Tcl
+        # round-trip)
+        input_type = self.input_type.get()
+        video_file = self.video_path.get()
+
+        if input_type == "file":
+            if not video_file:
                 messagebox.showwarning("No Video", "Please select a video file first")
                 return
-            video_file = self.video_path.get()
         else:
             messagebox.showinfo("Download First", "Please download the YouTube video first")
             return
         
-        # Confirm
-        if not messagebox.askyesno(
-            "Start Processing",
-            f"Start processing this video?\n\nSettings:\n• Model: {self.model_var.get()}\n• Clips: {self.clips_var.get()}\n\nThis may take several minutes."
-        ):
+        model_size = self.model_var.get()
+        num_clips = self.clips_var.get()
+
+        # Inline confirmation: a modal askyesno would block the mainloop, so
+        # require a second click within 3 seconds instead
+        if not self._pending_confirm:
+            self._pending_confirm = True
+            self.process_btn.config(text="✅ Confirm start?", style="Warning.TButton")
+            self.status_text.set(
+                f"Model: {model_size} • Clips: {num_clips} — click again to start"
+            )
+            self.root.after(3000, self._reset_confirm)
             return
-        
-        # Update config
-        self.clipper.config['transcription']['model_size'] = self.model_var.get()
-        self.clipper.config['ai_analysis']['top_n_clips'] = self.clips_var.get()
-        
+        self._reset_confirm()
+
+        # Snapshot the settings; the worker thread applies them so the UI
+        # thread never mutates state the worker is reading
+        request = ProcessingRequest(video=video_file, model=model_size, top_n=num_clips)
+
+
         # Disable controls
-        self.is_processing = True
-        self.process_btn.config(state=tk.DISABLED, text="⏳ PROCESSING...")
-        self.browse_btn.config(state=tk.DISABLED)
-        self.download_btn.config(state=tk.DISABLED)
-        self.open_output_btn.config(state=tk.DISABLED)
+        self._set_busy(True)
+        self.process_btn.config(text="⏳ PROCESSING...")
         self.progress_value.set(0)
+        self._last_pct = -1
+        self._last_status = None
         
         # Clear log
         self.log_text.delete(1.0, tk.END)
         
         # Start processing
-        thread = threading.Thread(target=self._process_video_thread, args=(video_file,), daemon=True)
+        thread = threading.Thread(target=self._process_video_thread, args=(request,), daemon=True)
         thread.start()
     
-    def _process_video_thread(self, video_file):
+    def _set_busy(self, busy):
+        """Single source of truth for the busy/idle control state."""
+        state = tk.DISABLED if busy else tk.NORMAL
+        for btn in self._busy_buttons:
+            btn.config(state=state)
+        self.is_processing = busy
+
+    def _reset_confirm(self):
+        """Reset the inline confirmation state on the process button."""
+        if self._pending_confirm:
+            self._pending_confirm = False
+            if not self.is_processing:
+                self.process_btn.config(
+                    text="🚀 START PROCESSING", style="Success.TButton"
+                )
+
+    def _process_video_thread(self, request):
         """Process video in background."""
         try:
             self.log_message("="*40, "info")
             self.log_message("🚀 Starting AI Clipper Pro", "info")
             self.log_message("="*40, "info")
-            
+
             self.update_progress(5, "Initializing...")
-            
-            # Process
-            result = self.clipper.process_video(video_file, output_dir=None)
+
+            # Apply the snapshotted settings and process
+            self.clipper.config['transcription']['model_size'] = request.model
+            self.clipper.config['ai_analysis']['top_n_clips'] = request.top_n
+
+            result = self.clipper.process_video(request.video, output_dir=None)
             
             self.result = result
             
@@ -675,9 +814,10 @@ class AIClipperModernGUI:
                 self.log_message(f"📁 Output: {result['output_directory']}", "info")
                 self.log_message(f"🎬 Clips: {result['clips_generated']}", "info")
                 
-                self.root.after(0, lambda: self.open_output_btn.config(state=tk.NORMAL))
-                
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.root.after(0, partial(self.open_output_btn.config, state=tk.NORMAL))
+
+                self.root.after(0, partial(
+                    messagebox.showinfo,
                     "🎉 Success!",
                     f"Processing complete!\n\n"
                     f"✓ Clips generated: {result['clips_generated']}\n"
@@ -691,27 +831,94 @@ class AIClipperModernGUI:
         except Exception as e:
             self.log_message(f"✗ ERROR: {str(e)}", "error")
             self.update_progress(0, "Error occurred")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Processing failed:\n\n{str(e)}"))
-        
+            self.root.after(0, partial(
+                messagebox.showerror, "Error", f"Processing failed:\n\n{str(e)}"
+            ))
+
         finally:
             self.is_processing = False
-            self.root.after(0, lambda: self.process_btn.config(state=tk.NORMAL, text="🚀 START PROCESSING"))
-            self.root.after(0, lambda: self.browse_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.download_btn.config(state=tk.NORMAL))
+            self.root.after(0, self._set_busy, False)
+            self.root.after(0, partial(
+                self.process_btn.config, text="🚀 START PROCESSING"
+            ))
     
     def update_progress(self, value, status):
-        """Update progress."""
-        self.root.after(0, lambda: self.progress_value.set(value))
-        self.root.after(0, lambda: self.status_text.set(status))
-        self.root.after(0, lambda: self.progress_label.config(text=f"{int(value)}%"))
-    
+        """Update progress (single scheduled callback, skips duplicate ticks)."""
+        if int(value) == self._last_pct and status == self._last_status:
+            return
+        self._last_pct = int(value)
+        self._last_status = status
+
+        def _apply(v=value, s=status):
+            # Don't redraw while minimized; the latest value is applied on <Map>
+            if self.root.state() == 'iconic':
+                self._pending_progress = (v, s)
+                return
+            self._pending_progress = None
+            self.progress_value.set(v)
+            self.status_text.set(s)
+            self.progress_label.config(text=f"{int(v)}%")
+
+        self.root.after_idle(_apply)
+
     def log_message(self, message, tag="info"):
-        """Add message to log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_line = f"[{timestamp}] {message}\n"
-        
-        self.root.after(0, lambda: self.log_text.insert(tk.END, log_line, tag))
-        self.root.after(0, lambda: self.log_text.see(tk.END))
+        """Queue a log line; the UI thread drains the queue in batches."""
+        # Only reformat the timestamp when the second actually changes
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        with self._log_lock:
+            self._log_queue.append((tag, f"[{self._ts_str}] {message}\n"))
+
+    def _drain_log(self):
+        """Flush all pending log lines in one insert per tag group."""
+        # Skip redraws while minimized; lines accumulate and flush on restore
+        if self.root.state() == 'iconic':
+            self._drain_after_id = self.root.after(500, self._drain_log)
+            return
+
+        with self._log_lock:
+            pending = list(self._log_queue)
+            self._log_queue.clear()
+
+        if pending:
+            # Only autoscroll if the user was already at the bottom
+            at_bottom = self.log_text.yview()[1] >= 1.0
+            # Group consecutive lines with the same tag into one insert
+            group_tag, group_lines = pending[0][0], [pending[0][1]]
+            for tag, line in pending[1:]:
+                if tag == group_tag:
+                    group_lines.append(line)
+                else:
+                    self.log_text.insert(tk.END, "".join(group_lines), group_tag)
+                    group_tag, group_lines = tag, [line]
+            self.log_text.insert(tk.END, "".join(group_lines), group_tag)
+
+            # Cap the buffer so redraws don't scale with run length
+            total_lines = int(self.log_text.index('end-1c').split('.')[0])
+            if total_lines > self.MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{total_lines - self.MAX_LOG_LINES + 1}.0')
+
+            if at_bottom:
+                # Cheaper than see(END): scrolls without re-measuring the
+                # end index geometry
+                self.log_text.yview_moveto(1.0)
+
+        self._drain_after_id = self.root.after(100, self._drain_log)
+
+    def _on_map(self, event=None):
+        """Apply deferred updates when the window is restored."""
+        if self._pending_progress is not None:
+            value, status = self._pending_progress
+            self._pending_progress = None
+            self.progress_value.set(value)
+            self.status_text.set(status)
+            self.progress_label.config(text=f"{int(value)}%")
+
+        if self._drain_after_id is not None:
+            self.root.after_cancel(self._drain_after_id)
+        self._drain_log()
     
     def _open_output_folder(self):
         """Open output folder."""
@@ -719,12 +926,15 @@ class AIClipperModernGUI:
             output_dir = self.result['output_directory']
             
             if os.path.exists(output_dir):
-                if sys.platform == 'win32':
-                    os.startfile(output_dir)
-                elif sys.platform == 'darwin':
-                    os.system(f'open "{output_dir}"')
-                else:
-                    os.system(f'xdg-open "{output_dir}"')
+                try:
+                    if sys.platform == 'win32':
+                        os.startfile(output_dir)
+                    elif sys.platform == 'darwin':
+                        subprocess.Popen(["open", output_dir], close_fds=True)
+                    else:
+                        subprocess.Popen(["xdg-open", output_dir], close_fds=True)
+                except Exception as e:
+                    self.log_message(f"✗ Could not open folder: {e}", "error")
             else:
                 messagebox.showerror("Error", "Output folder not found")
         else:
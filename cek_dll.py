@@ -12,29 +12,63 @@ base_paths = [
     "C:\\Program Files\\NVIDIA\\CUDNN\\v9.16",
 ]
 
+# Known layouts — probing these directly avoids walking the whole tree
+known_subdirs = [
+    "bin",
+    "bin\\13.0",
+    "lib\\x64",
+]
+
+
+def find_dll_dirs(base):
+    """Find directories containing DLLs under base, cheaply.
+
+    Probes known bin/lib subpaths first; only falls back to a pruned
+    os.walk (descending solely into bin/ subtrees) when none match.
+    """
+    hits = []
+
+    for sub in known_subdirs:
+        candidate = os.path.join(base, sub)
+        dlls = sorted(os.path.basename(p) for p in glob.glob(os.path.join(candidate, '*.dll')))
+        if dlls:
+            hits.append((candidate, dlls))
+    if hits:
+        return hits
+
+    base_depth = os.path.normpath(base).count(os.sep)
+    for root, dirs, files in os.walk(base):
+        in_bin = 'bin' in os.path.normpath(root).lower().split(os.sep)
+        if in_bin:
+            dlls = sorted(f for f in files if f.endswith('.dll'))
+            if dlls:
+                hits.append((root, dlls))
+                dirs[:] = []  # first hit per subtree is enough
+        elif root.count(os.sep) - base_depth >= 2:
+            # Prune descent: past depth 2, only bin/ can hold DLLs we want
+            dirs[:] = [d for d in dirs if d.lower() == 'bin']
+
+    return hits
+
+
 found_dll_paths = []
 
 for base in base_paths:
     print(f"\n📁 Checking: {base}")
-    
+
     if not os.path.exists(base):
         print(f"   ✗ Path not found!")
         continue
-    
-    # Search for bin folders
-    for root, dirs, files in os.walk(base):
-        if 'bin' in os.path.basename(root).lower():
-            dll_files = [f for f in files if f.endswith('.dll')]
-            
-            if dll_files:
-                print(f"   ✓ Found {len(dll_files)} DLLs in: {root}")
-                found_dll_paths.append(root)
-                
-                # Show some DLL names
-                for dll in dll_files[:5]:
-                    print(f"      - {dll}")
-                if len(dll_files) > 5:
-                    print(f"      ... and {len(dll_files) - 5} more")
+
+    for path, dll_files in find_dll_dirs(base):
+        print(f"   ✓ Found {len(dll_files)} DLLs in: {path}")
+        found_dll_paths.append(path)
+
+        # Show some DLL names
+        for dll in dll_files[:5]:
+            print(f"      - {dll}")
+        if len(dll_files) > 5:
+            print(f"      ... and {len(dll_files) - 5} more")
 
 print("\n" + "=" * 60)
 print("SUMMARY - Copy these paths:")
@@ -53,4 +87,4 @@ else:
     print("3. Look for 'bin' folder")
     print("4. Check if it contains .dll files")
 
-print("\n" + "=" * 60)
\ No newline at end of file
+print("\n" + "=" * 60)
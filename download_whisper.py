@@ -1,4 +1,4 @@
 from faster_whisper import WhisperModel
 
-model = WhisperModel("large-v2", device="cuda", compute_type="float16")
+model = WhisperModel("large-v2", device="cuda", compute_type="int8_float16")
 print("✅ Model downloaded & ready")
@@ -2,29 +2,45 @@
 
 import os
 import sys
+import json
 import yaml
+import hashlib
 import argparse
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+from time import perf_counter
 from typing import Dict, List, Optional
 
-from modules.video_processor import VideoProcessor
-from modules.transcriber import Transcriber
-from modules.ai_analyzer import AIAnalyzer
-from modules.clip_selector import ClipSelector
-from modules.video_editor import VideoEditor
-from modules.content_generator import ContentGenerator
-from modules.subtitle_generator_modern import ModernSubtitleGenerator
-from modules.uploader import Uploader
 from utils.logger import setup_logger
 from utils.validators import validate_input_video
 
+# Module imports (which pull in torch, faster-whisper, etc.) are deferred
+# to AIClipper.__init__ so `main.py --help` and GUI startup stay fast
+
 
 class AIClipper:
     """Main orchestrator for AI Clipper application."""
     
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize AI Clipper with configuration."""
+        # Heavy imports deferred until a clipper is actually constructed
+        from modules.video_processor import VideoProcessor
+        from modules.transcriber import Transcriber
+        from modules.ai_analyzer import AIAnalyzer
+        from modules.clip_selector import ClipSelector
+        from modules.video_editor import VideoEditor
+        from modules.content_generator import ContentGenerator
+        from modules.subtitle_generator_modern import ModernSubtitleGenerator
+        from modules.uploader import Uploader
+
         self.config = self._load_config(config_path)
         self.logger = setup_logger(
             level=self.config['logging']['level'],
@@ -45,10 +61,38 @@ class AIClipper:
         self.logger.info("AI Clipper initialized successfully")
     
     def _load_config(self, config_path: str) -> Dict:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file (with a JSON sidecar cache)."""
         try:
+            # JSON parses an order of magnitude faster than YAML, so reuse
+            # a sidecar keyed by the YAML file's mtime when available
+            mtime = int(os.path.getmtime(config_path))
+            cache_path = f"{config_path}.{mtime}.json"
+
+            # The cache is best-effort in both directions: a missing or
+            # corrupt sidecar must never block startup while the YAML
+            # itself is fine
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+
             with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(
+                    f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                )
+
+            try:
+                # Write-then-rename so a crash mid-write can't leave a
+                # truncated sidecar behind
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(config, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Cache is best-effort
+
+            return config
         except Exception as e:
             print(f"Error loading config: {e}")
             sys.exit(1)
@@ -64,6 +108,7 @@ class AIClipper:
         Returns:
             Dictionary with processing results and output paths
         """
+        self._stage_times = {}
         try:
             # Step 1: Validate input
             self.logger.info(f"Processing video: {video_path}")
@@ -82,24 +127,49 @@ class AIClipper:
             
             # Step 3: Extract audio
             self.logger.info("Step 1/8: Extracting audio...")
-            audio_path = self.video_processor.extract_audio(video_path)
-            
-            # Step 4: Transcribe
+            with self._stage("audio_extraction"):
+                audio_path = self.video_processor.extract_audio(video_path)
+
+            # Step 4: Transcribe (cached by audio fingerprint so re-runs
+            # on unchanged audio skip the Whisper pass entirely)
             self.logger.info("Step 2/8: Transcribing audio...")
-            transcript = self.transcriber.transcribe(audio_path)
+            with self._stage("transcription"):
+                transcript = self._load_transcript_cache(audio_path)
+                if transcript is None:
+                    transcript = self.transcriber.transcribe(audio_path)
+                    self._save_transcript_cache(audio_path, transcript)
+                else:
+                    self.logger.info("Using cached transcript for this audio")
             
             # Save transcript
             transcript_path = os.path.join(output_dir, "transcript.json")
             self.transcriber.save_transcript(transcript, transcript_path)
+
+            # Segment boundaries are time-sorted; precompute them once as
+            # flat float arrays (SoA) so each clip's transcript slice is
+            # a binary search over 8-byte floats, not dict lookups
+            seg_soa = self.transcriber.segment_processor.segments_to_soa(
+                transcript['segments']
+            )
+            seg_starts = seg_soa['starts']
+            seg_ends = seg_soa['ends']
             
-            # Step 5: AI Analysis
+            # Step 5: AI Analysis (cached by transcript + settings hash so
+            # re-runs on the same video skip the LLM scoring pass)
             self.logger.info("Step 3/8: Analyzing content with AI...")
-            candidates = self.ai_analyzer.generate_candidates(transcript)
-            scored_candidates = self.ai_analyzer.score_candidates(candidates)
-            
+            with self._stage("ai_analysis"):
+                scored_candidates = self._load_analysis_cache(transcript)
+                if scored_candidates is None:
+                    candidates = self.ai_analyzer.generate_candidates(transcript)
+                    scored_candidates = self.ai_analyzer.score_candidates(candidates)
+                    self._save_analysis_cache(transcript, scored_candidates)
+                else:
+                    self.logger.info("Using cached AI analysis for this transcript")
+
             # Step 6: Select best clips
             self.logger.info("Step 4/8: Selecting best clips...")
-            selected_clips = self.clip_selector.select_clips(scored_candidates)
+            with self._stage("clip_selection"):
+                selected_clips = self.clip_selector.select_clips(scored_candidates)
             
             if not selected_clips:
                 self.logger.error("No suitable clips found!")
@@ -108,89 +178,59 @@ class AIClipper:
             self.logger.info(f"Selected {len(selected_clips)} clips")
             
             # Step 7: Cut and edit videos with MODERN SUBTITLES
+            # Clips are independent, so process them in parallel; the heavy
+            # lifting happens in ffmpeg subprocesses, so threads suffice
             self.logger.info("Step 5/8: Cutting and editing videos...")
-            edited_clips = []
-            
-            for idx, clip in enumerate(selected_clips, 1):
-                self.logger.info(f"Processing clip {idx}/{len(selected_clips)}...")
-                
-                # Cut clip
-                clip_paths = self.video_editor.cut_clip(
-                    video_path=video_path,
-                    start_time=clip['start_time'],
-                    end_time=clip['end_time'],
-                    output_dir=output_dir,
-                    clip_index=idx
-                )
-                
-                # Generate clip transcript
-                clip_transcript = self._extract_clip_transcript(
-                    transcript, 
-                    clip['start_time'], 
-                    clip['end_time']
-                )
-                
-                # Generate MODERN ANIMATED subtitles for each format
-                self.logger.info(f"  Generating modern subtitles for clip {idx}...")
-                subtitle_paths = {}
-                
-                for format_name in clip_paths.keys():
-                    # Generate ASS subtitle (animated with karaoke effect)
-                    ass_path = self.subtitle_generator.generate_animated_ass(
-                        clip_transcript,
-                        output_dir,
-                        clip_index=idx,
-                        video_format=format_name
-                    )
-                    subtitle_paths[format_name] = ass_path
-                
-                # Also generate simple SRT (fallback for compatibility)
-                srt_path = self.subtitle_generator.generate_simple_srt(
-                    clip_transcript,
-                    output_dir,
-                    clip_index=idx
+            max_workers = min(
+                len(selected_clips),
+                self.config['video_editing'].get('clip_parallelism', os.cpu_count() or 1)
+            )
+
+            # Clip transcripts are loop-invariant inputs; extract them all
+            # up front so workers receive immutable, precomputed slices
+            clip_transcripts = [
+                self._extract_clip_transcript(
+                    transcript, clip['start_time'], clip['end_time'],
+                    seg_starts, seg_ends
                 )
-                
-                # Burn subtitles into video
-                self.logger.info(f"  Burning subtitles for clip {idx}...")
-                final_paths = {}
-                
-                for format_name, clip_path in clip_paths.items():
-                    ass_path = subtitle_paths[format_name]
-                    
-                    # Use ASS subtitle (supports animations)
-                    subtitled_path = self.video_editor.burn_subtitles_ass(
-                        clip_path,
-                        ass_path,
-                        format_name
-                    )
-                    final_paths[format_name] = subtitled_path
-                
-                edited_clips.append({
-                    'index': idx,
-                    'paths': final_paths,
-                    'subtitle_ass': subtitle_paths,
-                    'subtitle_srt': srt_path,
-                    'clip_data': clip
-                })
-            
-            # Step 8: Generate content
+                for clip in selected_clips
+            ]
+
+            edited_clips = []
+            with self._stage("video_editing"):
+                with ThreadPoolExecutor(max_workers=max_workers) as edit_pool:
+                    edit_futures = {
+                        edit_pool.submit(
+                            self._process_single_clip,
+                            idx, clip, video_path, output_dir,
+                            clip_transcripts[idx - 1]
+                        ): idx
+                        for idx, clip in enumerate(selected_clips, 1)
+                    }
+                    for future in as_completed(edit_futures):
+                        edited_clips.append(future.result())
+
+            # Restore deterministic clip order
+            edited_clips.sort(key=lambda c: c['index'])
+
+            # Step 8: Generate content for all clips in one LLM round-trip
             self.logger.info("Step 6/8: Generating captions, titles, and hashtags...")
-            for clip_info in edited_clips:
-                clip_text = clip_info['clip_data']['text']
-                
-                content = self.content_generator.generate_all(clip_text)
-                clip_info['content'] = content
-            
+            with self._stage("content_generation"):
+                contents = self.content_generator.generate_batch(
+                    [clip_info['clip_data']['text'] for clip_info in edited_clips]
+                )
+                for clip_info, content in zip(edited_clips, contents):
+                    clip_info['content'] = content
+
             # Step 9: Save metadata
             self.logger.info("Step 7/8: Saving metadata...")
             metadata_path = os.path.join(output_dir, "metadata.json")
             self._save_metadata(edited_clips, metadata_path)
-            
+
             # Step 10: Prepare for upload (but don't upload)
             self.logger.info("Step 8/8: Preparing upload configurations...")
             upload_configs = self.uploader.prepare_uploads(edited_clips)
-            
+
             upload_config_path = os.path.join(output_dir, "upload_configs.json")
             self.uploader.save_upload_configs(upload_configs, upload_config_path)
             
@@ -203,7 +243,8 @@ class AIClipper:
                 "transcript_path": transcript_path,
                 "metadata_path": metadata_path,
                 "upload_configs_path": upload_config_path,
-                "clips": edited_clips
+                "clips": edited_clips,
+                "stage_times": dict(self._stage_times)
             }
             
             # Save summary
@@ -222,41 +263,220 @@ class AIClipper:
             self.logger.error(f"Error processing video: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
     
-    def _extract_clip_transcript(self, full_transcript: Dict, 
-                                  start_time: float, end_time: float) -> List[Dict]:
+    @contextmanager
+    def _stage(self, name: str):
+        """Time a pipeline stage and record it for the run summary."""
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            dt = perf_counter() - t0
+            self._stage_times[name] = round(dt, 2)
+            self.logger.info(f"[{name}] {dt:.2f}s")
+
+    MAX_CACHE_ENTRIES = 100
+
+    def _analysis_cache_path(self, transcript: Dict) -> str:
+        """Cache path keyed by transcript content and analysis settings."""
+        key_material = json.dumps(
+            {'transcript': transcript, 'settings': self.config['ai_analysis']},
+            sort_keys=True
+        ).encode()
+        digest = hashlib.blake2b(key_material).hexdigest()[:16]
+        cache_dir = self.config['output'].get('cache_dir', './cache')
+        return os.path.join(cache_dir, f"ai_{digest}.json")
+
+    def _transcript_cache_path(self, audio_path: str) -> str:
+        """Cache path keyed by a fast audio fingerprint.
+
+        Hashes the first and last MB plus the file size instead of the
+        whole file, together with the transcription settings so a model
+        or language change invalidates the entry.
+        """
+        chunk = 1024 * 1024
+        size = os.path.getsize(audio_path)
+        h = hashlib.blake2b()
+        with open(audio_path, 'rb') as f:
+            h.update(f.read(chunk))
+            if size > 2 * chunk:
+                f.seek(-chunk, os.SEEK_END)
+                h.update(f.read(chunk))
+        h.update(str(size).encode())
+        h.update(json.dumps(self.config['transcription'], sort_keys=True).encode())
+        cache_dir = self.config['output'].get('cache_dir', './cache')
+        return os.path.join(cache_dir, f"transcript_{h.hexdigest()[:16]}.json")
+
+    def _load_transcript_cache(self, audio_path: str) -> Optional[Dict]:
+        """Load a cached transcript for this audio, if present."""
+        try:
+            cache_path = self._transcript_cache_path(audio_path)
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not read transcript cache: {str(e)}")
+        return None
+
+    def _save_transcript_cache(self, audio_path: str, transcript: Dict):
+        """Persist the transcript for future runs on the same audio."""
+        try:
+            cache_path = self._transcript_cache_path(audio_path)
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(transcript, f)
+        except Exception as e:
+            self.logger.warning(f"Could not write transcript cache: {str(e)}")
+
+    def _load_analysis_cache(self, transcript: Dict) -> Optional[List[Dict]]:
+        """Load cached scored candidates, if present."""
+        cache_path = self._analysis_cache_path(transcript)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not read analysis cache: {str(e)}")
+            return None
+
+    def _save_analysis_cache(self, transcript: Dict, scored_candidates: List[Dict]):
+        """Persist scored candidates and evict old cache entries."""
+        cache_path = self._analysis_cache_path(transcript)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(scored_candidates, f)
+
+            # Evict oldest entries beyond the cap
+            cache_dir = os.path.dirname(cache_path)
+            entries = sorted(
+                (os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+                 if name.startswith('ai_') and name.endswith('.json')),
+                key=os.path.getmtime
+            )
+            for stale in entries[:-self.MAX_CACHE_ENTRIES]:
+                os.remove(stale)
+        except Exception as e:
+            self.logger.warning(f"Could not write analysis cache: {str(e)}")
+
+    def _process_single_clip(self, idx: int, clip: Dict, video_path: str,
+                             output_dir: str,
+                             clip_transcript: List[Dict]) -> Dict:
+        """Cut, subtitle, and burn a single selected clip."""
+        self.logger.info(f"Processing clip {idx}...")
+
+        # Generate MODERN ANIMATED subtitles for each format
+        self.logger.info(f"  Generating modern subtitles for clip {idx}...")
+        subtitle_paths = {}
+
+        for format_config in self.config['video_editing']['output_formats']:
+            format_name = format_config['name']
+            # Generate ASS subtitle (animated with karaoke effect)
+            ass_path = self.subtitle_generator.generate_animated_ass(
+                clip_transcript,
+                output_dir,
+                clip_index=idx,
+                video_format=format_name
+            )
+            subtitle_paths[format_name] = ass_path
+
+        # Also generate simple SRT (fallback for compatibility)
+        srt_path = self.subtitle_generator.generate_simple_srt(
+            clip_transcript,
+            output_dir,
+            clip_index=idx
+        )
+
+        # Cut + burn in a single ffmpeg pass per format (one decode/encode
+        # cycle instead of two)
+        final_paths = self.video_editor.cut_and_burn(
+            video_path=video_path,
+            start_time=clip['start_time'],
+            end_time=clip['end_time'],
+            subtitle_paths=subtitle_paths,
+            output_dir=output_dir,
+            clip_index=idx
+        )
+
+        return {
+            'index': idx,
+            'paths': final_paths,
+            'subtitle_ass': subtitle_paths,
+            'subtitle_srt': srt_path,
+            'clip_data': clip
+        }
+
+    def _extract_clip_transcript(self, full_transcript: Dict,
+                                  start_time: float, end_time: float,
+                                  seg_starts: Optional[np.ndarray] = None,
+                                  seg_ends: Optional[np.ndarray] = None) -> List[Dict]:
         """Extract transcript segments for a specific clip."""
+        segments = full_transcript['segments']
+
+        if seg_starts is None:
+            seg_starts = np.fromiter(
+                (s['start'] for s in segments), dtype=np.float64, count=len(segments)
+            )
+        if seg_ends is None:
+            seg_ends = np.fromiter(
+                (s['end'] for s in segments), dtype=np.float64, count=len(segments)
+            )
+
+        # Segments are time-sorted, so binary-search the overlap window
+        # instead of scanning the full transcript per clip
+        lo = int(np.searchsorted(seg_ends, start_time, side='left'))
+        hi = int(np.searchsorted(seg_starts, end_time, side='right'))
+
+        clip_duration = end_time - start_time
+        window = segments[lo:hi]
+        if not window:
+            return []
+
+        # Vectorize the timestamp arithmetic; dicts are only materialized
+        # at the end with the adjusted values
+        starts = np.fromiter((s['start'] for s in window), dtype=np.float64,
+                             count=len(window))
+        ends = np.fromiter((s['end'] for s in window), dtype=np.float64,
+                           count=len(window))
+        adj_starts = np.maximum(0.0, starts - start_time)
+        adj_ends = np.minimum(clip_duration, ends - start_time)
+
         clip_segments = []
-        
-        for segment in full_transcript['segments']:
-            seg_start = segment['start']
-            seg_end = segment['end']
-            
-            # Check if segment overlaps with clip
-            if seg_end >= start_time and seg_start <= end_time:
-                # Adjust timestamps relative to clip start
-                adjusted_segment = segment.copy()
-                adjusted_segment['start'] = max(0, seg_start - start_time)
-                adjusted_segment['end'] = min(end_time - start_time, seg_end - start_time)
-                
-                # Adjust word timestamps if available
-                if 'words' in adjusted_segment and adjusted_segment['words']:
-                    adjusted_words = []
-                    for word in adjusted_segment['words']:
-                        if word['end'] >= start_time and word['start'] <= end_time:
-                            adjusted_word = word.copy()
-                            adjusted_word['start'] = max(0, word['start'] - start_time)
-                            adjusted_word['end'] = min(end_time - start_time, word['end'] - start_time)
-                            adjusted_words.append(adjusted_word)
-                    adjusted_segment['words'] = adjusted_words
-                
-                clip_segments.append(adjusted_segment)
-        
+        for segment, adj_start, adj_end in zip(window, adj_starts, adj_ends):
+            adjusted_segment = {
+                **segment,
+                'start': float(adj_start),
+                'end': float(adj_end)
+            }
+
+            # Adjust word timestamps if available; project straight into
+            # the {word, start, end, probability} shape downstream needs
+            # instead of copying whole dicts
+            words = segment.get('words')
+            if words:
+                w_starts = np.fromiter((w['start'] for w in words),
+                                       dtype=np.float64, count=len(words))
+                w_ends = np.fromiter((w['end'] for w in words),
+                                     dtype=np.float64, count=len(words))
+                keep = (w_ends >= start_time) & (w_starts <= end_time)
+                aw_starts = np.maximum(0.0, w_starts - start_time)
+                aw_ends = np.minimum(clip_duration, w_ends - start_time)
+                adjusted_segment['words'] = [
+                    {
+                        'word': words[i]['word'],
+                        'start': float(aw_starts[i]),
+                        'end': float(aw_ends[i]),
+                        'probability': words[i].get('probability', 1.0)
+                    }
+                    for i in np.flatnonzero(keep)
+                ]
+
+            clip_segments.append(adjusted_segment)
+
         return clip_segments
     
     def _save_metadata(self, clips: List[Dict], output_path: str):
         """Save metadata to JSON file."""
-        import json
-        
         # Convert to JSON-serializable format
         serializable_clips = []
         for clip in clips:
@@ -276,57 +496,113 @@ class AIClipper:
             }
             serializable_clips.append(serializable_clip)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(serializable_clips, f, indent=2, ensure_ascii=False)
+        # orjson (Rust-backed) serializes several-MB metadata much faster
+        # than stdlib json; fall back if it isn't installed
+        if orjson is not None:
+            Path(output_path).write_bytes(orjson.dumps(
+                serializable_clips,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(serializable_clips, f, indent=2, ensure_ascii=False)
     
     def _write_summary(self, summary: Dict, output_path: str):
         """Write human-readable summary file."""
+        # Assemble in memory and write once instead of dozens of f.write calls
+        parts = []
+        parts.append("=" * 70 + "\n")
+        parts.append("AI CLIPPER - PROCESSING SUMMARY\n")
+        parts.append("=" * 70 + "\n\n")
+
+        parts.append(f"Input Video: {summary['video_input']}\n")
+        parts.append(f"Output Directory: {summary['output_directory']}\n")
+        parts.append(f"Clips Generated: {summary['clips_generated']}\n\n")
+
+        parts.append("-" * 70 + "\n")
+        parts.append("GENERATED CLIPS\n")
+        parts.append("-" * 70 + "\n\n")
+
+        for clip in summary['clips']:
+            idx = clip['index']
+            content = clip.get('content', {})
+
+            parts.append(f"CLIP #{idx}\n")
+            parts.append(f"  Title: {content.get('title', 'N/A')}\n")
+            parts.append(f"  Caption: {content.get('caption', 'N/A')}\n")
+            parts.append(f"  Hashtags: {' '.join(content.get('hashtags', []))}\n")
+            parts.append(f"  Files:\n")
+            for format_name, path in clip['paths'].items():
+                parts.append(f"    - {format_name}: {path}\n")
+            parts.append(f"  Subtitles:\n")
+            for format_name, ass_path in clip['subtitle_ass'].items():
+                parts.append(f"    - ASS ({format_name}): {ass_path}\n")
+            parts.append(f"    - SRT (simple): {clip['subtitle_srt']}\n")
+            parts.append("\n")
+
+        if summary.get('stage_times'):
+            parts.append("-" * 70 + "\n")
+            parts.append("STAGE TIMINGS\n")
+            parts.append("-" * 70 + "\n")
+            for stage_name, seconds in summary['stage_times'].items():
+                parts.append(f"  {stage_name}: {seconds:.2f}s\n")
+            parts.append("\n")
+
+        parts.append("-" * 70 + "\n")
+        parts.append("SUBTITLE FEATURES\n")
+        parts.append("-" * 70 + "\n")
+        parts.append("+ Modern animated subtitles with karaoke effect\n")
+        parts.append("+ Word-by-word highlighting (active word = purple)\n")
+        parts.append("+ 2-3 words per line for readability\n")
+        parts.append("+ Smart word grouping with punctuation detection\n")
+        parts.append("+ Optimized for both Shorts (9:16) and YouTube (16:9)\n\n")
+
+        parts.append("-" * 70 + "\n")
+        parts.append("NEXT STEPS\n")
+        parts.append("-" * 70 + "\n")
+        parts.append("1. Review generated clips\n")
+        parts.append("2. Check upload_configs.json for API upload configuration\n")
+        parts.append("3. Run uploader module with appropriate credentials\n")
+        parts.append("4. Monitor upload status\n")
+
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 70 + "\n")
-            f.write("AI CLIPPER - PROCESSING SUMMARY\n")
-            f.write("=" * 70 + "\n\n")
-            
-            f.write(f"Input Video: {summary['video_input']}\n")
-            f.write(f"Output Directory: {summary['output_directory']}\n")
-            f.write(f"Clips Generated: {summary['clips_generated']}\n\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("GENERATED CLIPS\n")
-            f.write("-" * 70 + "\n\n")
-            
-            for clip in summary['clips']:
-                idx = clip['index']
-                content = clip.get('content', {})
-                
-                f.write(f"CLIP #{idx}\n")
-                f.write(f"  Title: {content.get('title', 'N/A')}\n")
-                f.write(f"  Caption: {content.get('caption', 'N/A')}\n")
-                f.write(f"  Hashtags: {' '.join(content.get('hashtags', []))}\n")
-                f.write(f"  Files:\n")
-                for format_name, path in clip['paths'].items():
-                    f.write(f"    - {format_name}: {path}\n")
-                f.write(f"  Subtitles:\n")
-                for format_name, ass_path in clip['subtitle_ass'].items():
-                    f.write(f"    - ASS ({format_name}): {ass_path}\n")
-                f.write(f"    - SRT (simple): {clip['subtitle_srt']}\n")
-                f.write("\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("SUBTITLE FEATURES\n")
-            f.write("-" * 70 + "\n")
-            f.write("+ Modern animated subtitles with karaoke effect\n")
-            f.write("+ Word-by-word highlighting (active word = purple)\n")
-            f.write("+ 2-3 words per line for readability\n")
-            f.write("+ Smart word grouping with punctuation detection\n")
-            f.write("+ Optimized for both Shorts (9:16) and YouTube (16:9)\n\n")
-            
-            f.write("-" * 70 + "\n")
-            f.write("NEXT STEPS\n")
-            f.write("-" * 70 + "\n")
-            f.write("1. Review generated clips\n")
-            f.write("2. Check upload_configs.json for API upload configuration\n")
-            f.write("3. Run uploader module with appropriate credentials\n")
-            f.write("4. Monitor upload status\n")
+            f.write(''.join(parts))
+
+
+def _report_result(result: Dict):
+    """Print the outcome of one processed video."""
+    if result['success']:
+        print("\n" + "="*60)
+        print("SUCCESS! Processing completed successfully!")
+        print("="*60)
+        print(f"\nOutput directory: {result['output_directory']}")
+        print(f"Clips generated: {result['clips_generated']}")
+        print(f"\nFeatures:")
+        print("  + Modern animated subtitles")
+        print("  + Word-by-word purple highlighting")
+        print("  + 2-3 words per line")
+        print("  + Optimized for viral content")
+        print("\n" + "="*60)
+    else:
+        print(f"\nERROR: Processing failed: {result.get('error', 'Unknown error')}")
+
+
+def _serve(clipper: 'AIClipper', output_dir: str = None):
+    """Process video paths from stdin, one per line, with models resident.
+
+    Model loading (Whisper + embeddings) dominates short jobs; keeping one
+    AIClipper alive amortizes it across many videos.
+    """
+    print("AI Clipper serve mode — enter one video path per line (Ctrl+D to quit)")
+    for line in sys.stdin:
+        video_path = line.strip()
+        if not video_path:
+            continue
+        if not os.path.exists(video_path):
+            print(f"ERROR: File not found: {video_path}")
+            continue
+        _report_result(clipper.process_video(video_path, output_dir))
 
 
 def main():
@@ -335,8 +611,10 @@ def main():
         description="AI Clipper - Automatically create viral clips from long videos"
     )
     parser.add_argument(
-        "video",
-        help="Path to input video file"
+        "videos",
+        nargs="*",
+        metavar="video",
+        help="Path(s) to input video file(s); all are processed with one model load"
     )
     parser.add_argument(
         "-c", "--config",
@@ -347,29 +625,43 @@ def main():
         "-o", "--output",
         help="Custom output directory (optional)"
     )
-    
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep models loaded and read video paths from stdin, one per line"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Re-run under py-spy and write a flamegraph to profile.svg"
+    )
+
     args = parser.parse_args()
-    
-    # Initialize and run
+
+    if not args.videos and not args.serve:
+        parser.error("provide at least one video path, or --serve")
+
+    if args.profile and not os.environ.get('AI_CLIPPER_PROFILING'):
+        # Re-exec this invocation under py-spy; the env guard prevents
+        # the profiled child from recursing
+        os.environ['AI_CLIPPER_PROFILING'] = '1'
+        os.execvp('py-spy', ['py-spy', 'record', '-o', 'profile.svg', '--',
+                             sys.executable] + sys.argv)
+
+    # Initialize once; models stay resident across all videos
     clipper = AIClipper(config_path=args.config)
-    result = clipper.process_video(args.video, args.output)
-    
-    if result['success']:
-        print("\n" + "="*60)
-        print("SUCCESS! Processing completed successfully!")
-        print("="*60)
-        print(f"\nOutput directory: {result['output_directory']}")
-        print(f"Clips generated: {result['clips_generated']}")
-        print(f"\nFeatures:")
-        print("  + Modern animated subtitles")
-        print("  + Word-by-word purple highlighting")
-        print("  + 2-3 words per line")
-        print("  + Optimized for viral content")
-        print("\n" + "="*60)
-        sys.exit(0)
-    else:
-        print(f"\nERROR: Processing failed: {result.get('error', 'Unknown error')}")
-        sys.exit(1)
+
+    failures = 0
+    for video_path in args.videos:
+        result = clipper.process_video(video_path, args.output)
+        _report_result(result)
+        if not result['success']:
+            failures += 1
+
+    if args.serve:
+        _serve(clipper, args.output)
+
+    sys.exit(1 if failures else 0)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 # File: modules/clip_selector.py
 
+from bisect import bisect_left
 from typing import Dict, List
 
 
@@ -27,8 +28,11 @@ class ClipSelector:
             min_gap = self.config['ai_analysis'].get('min_gap_between_clips', 10)  # seconds
             
             selected = []
-            used_timeranges = []
-            
+            # Accepted ranges kept sorted by start so each candidate only
+            # checks its two neighbors instead of every accepted clip
+            sorted_starts = []
+            sorted_ends = []
+
             # Group candidates by score tiers for better distribution
             score_threshold = 70  # Consider clips with score > 70 as "viral"
             viral_clips = [c for c in scored_candidates if c['scores']['composite'] > score_threshold]
@@ -41,9 +45,9 @@ class ClipSelector:
                 if len(selected) >= top_n:
                     break
                 
-                if self._can_add_clip(candidate, used_timeranges, min_gap):
+                if self._can_add_clip(candidate, sorted_starts, sorted_ends, min_gap):
                     selected.append(candidate)
-                    used_timeranges.append((candidate['start_time'], candidate['end_time']))
+                    self._add_range(candidate, sorted_starts, sorted_ends)
                     self.logger.info(
                         f"Selected VIRAL clip: {candidate['start_time']:.1f}s - {candidate['end_time']:.1f}s "
                         f"(score: {candidate['scores']['composite']:.1f})"
@@ -54,9 +58,9 @@ class ClipSelector:
                 if len(selected) >= top_n:
                     break
                 
-                if self._can_add_clip(candidate, used_timeranges, min_gap):
+                if self._can_add_clip(candidate, sorted_starts, sorted_ends, min_gap):
                     selected.append(candidate)
-                    used_timeranges.append((candidate['start_time'], candidate['end_time']))
+                    self._add_range(candidate, sorted_starts, sorted_ends)
                     self.logger.info(
                         f"Selected clip: {candidate['start_time']:.1f}s - {candidate['end_time']:.1f}s "
                         f"(score: {candidate['scores']['composite']:.1f})"
@@ -72,34 +76,31 @@ class ClipSelector:
             self.logger.error(f"Error selecting clips: {str(e)}")
             raise
     
-    def _can_add_clip(self, candidate: Dict, used_ranges: List, min_gap: float) -> bool:
-        """Check if clip can be added without overlap or being too close."""
+    def _can_add_clip(self, candidate: Dict, sorted_starts: List[float],
+                      sorted_ends: List[float], min_gap: float) -> bool:
+        """Check if clip can be added without overlap or being too close.
+
+        Accepted ranges are sorted and non-overlapping, so only the
+        neighbor on each side of the insertion point can conflict.
+        """
         start = candidate['start_time']
         end = candidate['end_time']
-        
-        for used_start, used_end in used_ranges:
-            # Check overlap
-            if self._has_overlap(start, end, used_start, used_end):
-                return False
-            
-            # Check if too close
-            if self._too_close(start, end, used_start, used_end, min_gap):
-                return False
-        
+
+        i = bisect_left(sorted_starts, start)
+
+        # Left neighbor must end at least min_gap before this start
+        if i > 0 and sorted_ends[i - 1] + min_gap > start:
+            return False
+
+        # Right neighbor must begin at least min_gap after this end
+        if i < len(sorted_starts) and end + min_gap > sorted_starts[i]:
+            return False
+
         return True
-    
-    def _has_overlap(self, start1: float, end1: float, start2: float, end2: float) -> bool:
-        """Check if two time ranges overlap."""
-        return not (end1 <= start2 or end2 <= start1)
-    
-    def _too_close(self, start1: float, end1: float, start2: float, end2: float, min_gap: float) -> bool:
-        """Check if two clips are too close to each other."""
-        # Distance between clips
-        if end1 < start2:
-            gap = start2 - end1
-        elif end2 < start1:
-            gap = start1 - end2
-        else:
-            return True  # Overlapping
-        
-        return gap < min_gap
\ No newline at end of file
+
+    def _add_range(self, candidate: Dict, sorted_starts: List[float],
+                   sorted_ends: List[float]):
+        """Insert an accepted clip's range, keeping both lists sorted."""
+        i = bisect_left(sorted_starts, candidate['start_time'])
+        sorted_starts.insert(i, candidate['start_time'])
+        sorted_ends.insert(i, candidate['end_time'])
\ No newline at end of file
@@ -1,10 +1,18 @@
+import os
+import re
+import json
+import hashlib
 import requests
-from typing import Dict
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from prompts.caption_prompt import CAPTION_PROMPT
 from prompts.title_prompt import TITLE_PROMPT
 from prompts.hashtag_prompt import HASHTAG_PROMPT
 
+_HASHTAG_RE = re.compile(r'#[A-Za-z0-9_]+')
+
 
 class ContentGenerator:
     """Generates captions, titles, descriptions, and hashtags using LLM."""
@@ -14,7 +22,37 @@ class ContentGenerator:
         self.logger = logger
         self.ollama_host = config['ai_analysis']['ollama_host']
         self.llm_model = config['ai_analysis']['llm_model']
-        self.temperature = config['content_generation']['temperature']
+        # Content limits read once; these are hit on every generation call
+        gen_config = config['content_generation']
+        self.temperature = gen_config['temperature']
+        self.max_caption_length = gen_config['max_caption_length']
+        self.max_title_length = gen_config['max_title_length']
+        self.max_description_length = gen_config['max_description_length']
+        self.num_hashtags = gen_config['num_hashtags']
+        self.cache_dir = config['output'].get('cache_dir', './cache')
+        # Keep-alive session: reuse sockets across the many small LLM
+        # calls instead of a TCP handshake per request
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        # Pre-serialized request templates: model/stream/temperature never
+        # change per instance, so only the prompt is encoded per call
+        base_body = {
+            "model": self.llm_model,
+            "prompt": "__PROMPT__",
+            "stream": False,
+            "temperature": self.temperature
+        }
+        self._req_template = json.dumps(base_body).encode()
+        self._req_template_json = json.dumps({**base_body, "format": "json"}).encode()
+        # Prompt templates only vary in the clip text: bind the constant
+        # limits now and split on the content slot, so each call is a
+        # join instead of re-parsing a 2 KB format string
+        self._caption_parts = CAPTION_PROMPT.replace(
+            '{max_length}', str(self.max_caption_length)).split('{content}')
+        self._title_parts = TITLE_PROMPT.replace(
+            '{max_length}', str(self.max_title_length)).split('{content}')
+        self._hashtag_parts = HASHTAG_PROMPT.replace(
+            '{num_hashtags}', str(self.num_hashtags)).split('{content}')
     
     def generate_all(self, clip_text: str) -> Dict:
         """
@@ -28,42 +66,216 @@ class ContentGenerator:
         """
         try:
             self.logger.info("Generating content...")
-            
-            caption = self.generate_caption(clip_text)
-            title = self.generate_title(clip_text)
-            description = self.generate_description(clip_text)
-            hashtags = self.generate_hashtags(clip_text)
-            
+
+            # One combined JSON-mode request replaces four sequential
+            # round-trips; individual generators remain as the fallback
+            content = self._generate_all_combined(clip_text)
+            if content is not None:
+                return content
+
+            # The four calls are independent I/O waits — overlap them
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                caption = pool.submit(self.generate_caption, clip_text)
+                title = pool.submit(self.generate_title, clip_text)
+                description = pool.submit(self.generate_description, clip_text)
+                hashtags = pool.submit(self.generate_hashtags, clip_text)
+
             return {
-                'caption': caption,
-                'title': title,
-                'description': description,
-                'hashtags': hashtags
+                'caption': caption.result(),
+                'title': title.result(),
+                'description': description.result(),
+                'hashtags': hashtags.result()
             }
-            
+
         except Exception as e:
             self.logger.error(f"Error generating content: {str(e)}")
             raise
+
+    def _generate_all_combined(self, clip_text: str) -> Optional[Dict]:
+        """Generate all content fields with a single JSON-mode LLM call."""
+        prompt = f"""You are a social media content expert for TikTok, Instagram Reels, and YouTube Shorts.
+
+For the video transcript below, generate:
+- "title": a viral title (max {self.max_title_length} characters)
+- "caption": a short hook caption (max {self.max_caption_length} characters, no hashtags)
+- "description": a compelling description (max {self.max_description_length} characters)
+- "hashtags": exactly {self.num_hashtags} hashtags, each starting with #
+
+Transcript:
+{clip_text}
+
+Respond ONLY with a JSON object with the keys "title", "caption", "description", "hashtags":"""
+
+        response = self._call_llm(prompt, json_format=True)
+        try:
+            start = response.index('{')
+            end = response.rindex('}') + 1
+            entry = json.loads(response[start:end])
+        except (ValueError, json.JSONDecodeError):
+            self.logger.warning("Could not parse combined content, falling back")
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        hashtags = [
+            tag if tag.startswith('#') else f"#{tag}"
+            for tag in entry.get('hashtags', [])
+            if isinstance(tag, str) and tag.strip()
+        ]
+        return {
+            'caption': str(entry.get('caption', '')).strip(),
+            'title': str(entry.get('title', '')).strip(),
+            'description': str(entry.get('description', '')).strip(),
+            'hashtags': hashtags[:self.num_hashtags]
+        }
     
+    def generate_batch(self, clip_texts: List[str]) -> List[Dict]:
+        """
+        Generate content for many clips in a single LLM request.
+
+        One round-trip instead of four per clip; falls back to per-clip
+        generation if the batched response can't be parsed.
+
+        Args:
+            clip_texts: Text content of each clip
+
+        Returns:
+            List of content dictionaries, one per clip
+        """
+        if not clip_texts:
+            return []
+
+        # Reuse cached content where available; only hit the LLM for the rest
+        results: List[Optional[Dict]] = [self._load_cached(text) for text in clip_texts]
+        pending = [i for i, content in enumerate(results) if content is None]
+        if not pending:
+            self.logger.info("Using cached content for all clips")
+            return results
+
+        generated = self._generate_batch_uncached([clip_texts[i] for i in pending])
+        for i, content in zip(pending, generated):
+            results[i] = content
+            self._save_cached(clip_texts[i], content)
+
+        return results
+
+    def _generate_batch_uncached(self, clip_texts: List[str]) -> List[Dict]:
+        """Generate content for clips with no cache entry."""
+        try:
+            self.logger.info(
+                f"Generating content for {len(clip_texts)} clips in one request..."
+            )
+
+            numbered = "\n\n".join(
+                f"Transcript {i}:\n{text}"
+                for i, text in enumerate(clip_texts, 1)
+            )
+
+            prompt = f"""You are a social media content expert for TikTok, Instagram Reels, and YouTube Shorts.
+
+For EACH of the {len(clip_texts)} video transcripts below, generate:
+- "title": a viral title (max {self.max_title_length} characters)
+- "caption": a short hook caption (max {self.max_caption_length} characters, no hashtags)
+- "description": a compelling description (max {self.max_description_length} characters)
+- "hashtags": exactly {self.num_hashtags} hashtags, each starting with #
+
+{numbered}
+
+Respond ONLY with a JSON array of {len(clip_texts)} objects, one per transcript, in order, each with the keys "title", "caption", "description", "hashtags":"""
+
+            response = self._call_llm(prompt)
+            results = self._parse_batch_response(response, len(clip_texts))
+            if results is not None:
+                return results
+
+            self.logger.warning("Could not parse batched content, falling back per clip")
+
+        except Exception as e:
+            self.logger.warning(f"Batch content generation failed: {str(e)}")
+
+        return self.generate_for_clips(clip_texts)
+
+    def generate_for_clips(self, clip_texts: List[str]) -> List[Dict]:
+        """Generate content per clip concurrently.
+
+        Fallback for when the single batched request can't be used; the
+        per-clip calls are I/O-bound waits on Ollama.
+        """
+        if not clip_texts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(clip_texts))) as pool:
+            return list(pool.map(self.generate_all, clip_texts))
+
+    def _cache_path(self, clip_text: str) -> str:
+        """Cache path keyed by clip text hash."""
+        digest = hashlib.sha256(clip_text.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"content_{digest}.json")
+
+    def _load_cached(self, clip_text: str) -> Optional[Dict]:
+        """Load cached content for a clip, if present."""
+        cache_path = self._cache_path(clip_text)
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _save_cached(self, clip_text: str, content: Dict):
+        """Persist generated content for a clip."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_path(clip_text), 'w', encoding='utf-8') as f:
+                json.dump(content, f)
+        except Exception as e:
+            self.logger.warning(f"Could not write content cache: {str(e)}")
+
+    def _parse_batch_response(self, response: str, expected: int) -> Optional[List[Dict]]:
+        """Parse the JSON array from a batched LLM response."""
+        try:
+            start = response.index('[')
+            end = response.rindex(']') + 1
+            entries = json.loads(response[start:end])
+        except (ValueError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(entries, list) or len(entries) != expected:
+            return None
+
+        num_hashtags = self.num_hashtags
+        results = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                return None
+            hashtags = [
+                tag if tag.startswith('#') else f"#{tag}"
+                for tag in entry.get('hashtags', [])
+                if isinstance(tag, str) and tag.strip()
+            ]
+            results.append({
+                'caption': str(entry.get('caption', '')).strip(),
+                'title': str(entry.get('title', '')).strip(),
+                'description': str(entry.get('description', '')).strip(),
+                'hashtags': hashtags[:num_hashtags]
+            })
+
+        return results
+
     def generate_caption(self, clip_text: str) -> str:
         """Generate short caption for social media."""
-        prompt = CAPTION_PROMPT.format(
-            content=clip_text,
-            max_length=self.config['content_generation']['max_caption_length']
-        )
+        prompt = clip_text.join(self._caption_parts)
         return self._call_llm(prompt).strip()
     
     def generate_title(self, clip_text: str) -> str:
         """Generate title for the clip."""
-        prompt = TITLE_PROMPT.format(
-            content=clip_text,
-            max_length=self.config['content_generation']['max_title_length']
-        )
+        prompt = clip_text.join(self._title_parts)
         return self._call_llm(prompt).strip()
     
     def generate_description(self, clip_text: str) -> str:
         """Generate longer description."""
-        prompt = f"""Based on this video content, write a compelling description for social media (max {self.config['content_generation']['max_description_length']} characters):
+        prompt = f"""Based on this video content, write a compelling description for social media (max {self.max_description_length} characters):
 
 Content: {clip_text}
 
@@ -78,38 +290,33 @@ Description:"""
     
     def generate_hashtags(self, clip_text: str) -> list:
         """Generate relevant hashtags."""
-        prompt = HASHTAG_PROMPT.format(
-            content=clip_text,
-            num_hashtags=self.config['content_generation']['num_hashtags']
-        )
+        prompt = clip_text.join(self._hashtag_parts)
         response = self._call_llm(prompt).strip()
-        
-        # Parse hashtags
-        hashtags = []
-        for line in response.split('\n'):
-            line = line.strip()
-            if line.startswith('#'):
-                hashtags.extend([tag.strip() for tag in line.split() if tag.startswith('#')])
-        
+
+        # One compiled-regex pass replaces the nested split loops;
+        # dict.fromkeys dedupes repeats while preserving order
+        hashtags = list(dict.fromkeys(tag.lower() for tag in _HASHTAG_RE.findall(response)))
+
         # Ensure we have the right number
-        if len(hashtags) < self.config['content_generation']['num_hashtags']:
-            # Add generic ones
+        if len(hashtags) < self.num_hashtags:
+            # Add generic ones, skipping any the LLM already produced
             generic = ['#viral', '#trending', '#fyp', '#foryou', '#explore']
-            hashtags.extend(generic[:self.config['content_generation']['num_hashtags'] - len(hashtags)])
-        
-        return hashtags[:self.config['content_generation']['num_hashtags']]
+            hashtags.extend(
+                tag for tag in generic
+                if tag not in hashtags
+            )
+
+        return hashtags[:self.num_hashtags]
     
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, json_format: bool = False) -> str:
         """Call Ollama API."""
         try:
-            response = requests.post(
+            template = self._req_template_json if json_format else self._req_template
+            body = template.replace(b'"__PROMPT__"', json.dumps(prompt).encode())
+            response = self._session.post(
                 f"{self.ollama_host}/api/generate",
-                json={
-                    "model": self.llm_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "temperature": self.temperature
-                },
+                data=body,
+                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
@@ -1,7 +1,16 @@
 # File: modules/device_manager.py
 
 import os
+import glob
 import platform
+import re
+
+# Bind torch once at import time; the inline imports re-ran the
+# sys.modules lookup on every diagnostics call
+try:
+    import torch as _torch
+except ImportError:
+    _torch = None
 
 
 class DeviceManager:
@@ -10,6 +19,10 @@ class DeviceManager:
     def __init__(self, logger):
         self.logger = logger
         self.is_windows = platform.system() == 'Windows'
+        # Memoized CUDA probes; availability and device properties are
+        # static for the life of the process
+        self._cuda_cached = None
+        self._device_info_cached = None
     
     def setup_cuda_environment(self):
         """Setup CUDA/CUDNN environment if on Windows."""
@@ -17,23 +30,35 @@ class DeviceManager:
             return
         
         try:
-            cuda_paths = [
-                r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v13.0\bin",
-                r"C:\Program Files\NVIDIA\CUDNN\v9.16\bin",
+            # Glob for installed versions instead of hardcoding v13.0 /
+            # v9.16, sorting on the numeric version components — a
+            # lexicographic sort would rank v9.6 above v9.16
+            cuda_patterns = [
+                r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA\v*\bin",
+                r"C:\Program Files\NVIDIA\CUDNN\v*\bin",
             ]
-            
+
+            def version_key(path):
+                return tuple(
+                    int(part)
+                    for part in re.findall(r'\d+', os.path.basename(os.path.dirname(path)))
+                )
+
             added_count = 0
-            for path in cuda_paths:
-                if os.path.exists(path):
-                    try:
-                        os.add_dll_directory(path)
-                        self.logger.info(f"[OK] Added CUDA path: {path}")
-                        added_count += 1
-                    except Exception as e:
-                        self.logger.warning(f"[WARNING] Could not add {path}: {e}")
-                else:
-                    self.logger.error(f"[ERROR] Path not found: {path}")
-            
+            for pattern in cuda_patterns:
+                matches = sorted(glob.glob(pattern), key=version_key, reverse=True)
+                if not matches:
+                    self.logger.error(f"[ERROR] No path matching: {pattern}")
+                    continue
+
+                path = matches[0]
+                try:
+                    os.add_dll_directory(path)
+                    self.logger.info(f"[OK] Added CUDA path: {path}")
+                    added_count += 1
+                except Exception as e:
+                    self.logger.warning(f"[WARNING] Could not add {path}: {e}")
+
             if added_count == 0:
                 raise FileNotFoundError("Could not add any CUDA paths!")
             
@@ -61,30 +86,56 @@ class DeviceManager:
         return 'cpu'
     
     def _is_cuda_available(self) -> bool:
-        """Check if CUDA is available."""
+        """Check if CUDA is available (memoized after the first probe)."""
+        if self._cuda_cached is not None:
+            return self._cuda_cached
+
+        if _torch is None:
+            self.logger.error("PyTorch not installed!")
+            return False
+
         try:
-            import torch
-            available = torch.cuda.is_available()
-            
+            from utils.device import CUDA_OK
+            available = CUDA_OK
+
             if available:
-                self.logger.info(f"CUDA Version: {torch.version.cuda}")
-                self.logger.info(f"cuDNN Version: {torch.backends.cudnn.version()}")
-                self.logger.info(f"GPU Device: {torch.cuda.get_device_name(0)}")
-                
-                props = torch.cuda.get_device_properties(0)
+                self.logger.info(f"CUDA Version: {_torch.version.cuda}")
+                self.logger.info(f"cuDNN Version: {_torch.backends.cudnn.version()}")
+                self.logger.info(f"GPU Device: {_torch.cuda.get_device_name(0)}")
+
+                props = _torch.cuda.get_device_properties(0)
                 self.logger.info(f"GPU Memory: {props.total_memory / 1024**3:.2f} GB")
-            
+
+            self._cuda_cached = available
             return available
-            
-        except ImportError:
-            self.logger.error("PyTorch not installed!")
-            return False
+
         except Exception as e:
             self.logger.error(f"Error checking CUDA: {str(e)}")
             return False
     
     def get_device_info(self) -> dict:
-        """Get detailed device information."""
+        """Get detailed device information.
+
+        Static fields (names, totals, versions) come from a one-time
+        probe; only the live memory counters are re-queried per call.
+        """
+        if self._device_info_cached is None:
+            self._device_info_cached = self._query_device_info()
+
+        info = self._device_info_cached
+        if _torch is not None and info['cuda_available']:
+            try:
+                for device_info in info['devices']:
+                    i = device_info['id']
+                    device_info['memory_allocated_gb'] = _torch.cuda.memory_allocated(i) / 1024**3
+                    device_info['memory_cached_gb'] = _torch.cuda.memory_reserved(i) / 1024**3
+            except Exception as e:
+                self.logger.warning(f"Could not refresh device memory info: {str(e)}")
+
+        return info
+
+    def _query_device_info(self) -> dict:
+        """Probe torch for the full device inventory."""
         info = {
             'platform': platform.system(),
             'cuda_available': False,
@@ -92,26 +143,29 @@ class DeviceManager:
             'devices': []
         }
         
+        if _torch is None:
+            return info
+
         try:
-            import torch
-            info['cuda_available'] = torch.cuda.is_available()
-            
+            from utils.device import CUDA_OK
+            info['cuda_available'] = CUDA_OK
+
             if info['cuda_available']:
-                info['device_count'] = torch.cuda.device_count()
-                info['cuda_version'] = torch.version.cuda
-                info['cudnn_version'] = torch.backends.cudnn.version()
-                
+                info['device_count'] = _torch.cuda.device_count()
+                info['cuda_version'] = _torch.version.cuda
+                info['cudnn_version'] = _torch.backends.cudnn.version()
+
                 for i in range(info['device_count']):
-                    props = torch.cuda.get_device_properties(i)
+                    props = _torch.cuda.get_device_properties(i)
                     device_info = {
                         'id': i,
                         'name': props.name,
                         'memory_total_gb': props.total_memory / 1024**3,
-                        'memory_allocated_gb': torch.cuda.memory_allocated(i) / 1024**3,
-                        'memory_cached_gb': torch.cuda.memory_reserved(i) / 1024**3
+                        'memory_allocated_gb': _torch.cuda.memory_allocated(i) / 1024**3,
+                        'memory_cached_gb': _torch.cuda.memory_reserved(i) / 1024**3
                     }
                     info['devices'].append(device_info)
-        
+
         except Exception as e:
             self.logger.warning(f"Could not get device info: {str(e)}")
         
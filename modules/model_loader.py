@@ -1,8 +1,20 @@
 # File: modules/model_loader.py
 
-from typing import Dict
+from typing import Dict, Tuple
 from faster_whisper import WhisperModel
 
+try:
+    import torch as _torch
+except ImportError:
+    # faster-whisper runs on CTranslate2 without torch; only the
+    # GPU-generation probe below needs it
+    _torch = None
+
+# Loaded models keyed by (size, device, compute_type). Model load plus
+# cuDNN handle init costs seconds; repeated pipeline runs in the same
+# process reuse the resident weights instead of paying it again.
+_MODEL_CACHE: Dict[Tuple[str, str, str], WhisperModel] = {}
+
 
 class ModelLoader:
     """Handles loading and configuration of Whisper models."""
@@ -25,7 +37,13 @@ class ModelLoader:
             model_config = self.config['transcription']
             model_size = model_config['model_size']
             compute_type = self._get_compute_type(device, model_config.get('compute_type'))
-            
+
+            cache_key = (model_size, device, compute_type)
+            cached = _MODEL_CACHE.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Reusing loaded Whisper model: {model_size}")
+                return cached
+
             self.logger.info(f"Loading Whisper model: {model_size}")
             self.logger.info(f"Device: {device}")
             self.logger.info(f"Compute type: {compute_type}")
@@ -47,11 +65,25 @@ class ModelLoader:
             if 'download_root' in model_config:
                 model_params['download_root'] = model_config['download_root']
             
-            model = WhisperModel(**model_params)
-            
+            try:
+                model = WhisperModel(**model_params)
+            except ValueError:
+                # Older CTranslate2 builds may not support quantized
+                # compute types — retry with plain float16
+                if device == 'cuda' and compute_type != 'float16':
+                    self.logger.warning(
+                        f"Compute type {compute_type} not supported, "
+                        f"falling back to float16"
+                    )
+                    model_params['compute_type'] = 'float16'
+                    model = WhisperModel(**model_params)
+                else:
+                    raise
+
             self.logger.info("Model loaded successfully")
             self._log_model_info(model, model_size)
-            
+
+            _MODEL_CACHE[cache_key] = model
             return model
             
         except Exception as e:
@@ -71,10 +103,24 @@ class ModelLoader:
         """
         if config_compute_type:
             return config_compute_type
-        
+
         # Auto-determine based on device
         if device == 'cuda':
-            return 'float16'  # Best for GPU
+            # Pick by GPU generation when torch can tell us: Ada (8.9+)
+            # runs int8 weights + fp16 activations ~2x faster than
+            # plain fp16 at <1% WER delta on English; Volta through
+            # Ampere get fp16 tensor cores; anything older lacks fast
+            # fp16 and does better on int8
+            if _torch is not None and _torch.cuda.is_available():
+                capability = _torch.cuda.get_device_capability()
+                if capability >= (8, 9):
+                    return 'int8_float16'
+                if capability >= (7, 0):
+                    return 'float16'
+                return 'int8'
+            # No torch to probe with — keep the aggressive default;
+            # load_model already falls back to float16 on ValueError
+            return 'int8_float16'
         else:
             return 'int8'  # Best for CPU
     
@@ -1,6 +1,15 @@
 # File: modules/segment_processor.py
 
-from typing import Dict, List, Any
+import io
+import operator
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Any, Optional
+
+import numpy as np
+
+# Word fields fetched as one tuple per word via a single C call
+_WORD_FIELDS = ('word', 'start', 'end', 'probability')
+_WORD_GET = operator.attrgetter(*_WORD_FIELDS)
 
 
 class SegmentProcessor:
@@ -22,20 +31,20 @@ class SegmentProcessor:
             Formatted transcript dictionary
         """
         try:
-            transcript_segments = []
-            full_text = []
-            
-            for segment in segments:
-                segment_data = self._process_single_segment(segment, include_word_timestamps)
-                transcript_segments.append(segment_data)
-                full_text.append(segment.text.strip())
-            
+            # Accumulate the full text in a StringIO buffer; the segment
+            # dicts already hold the stripped text, so no parallel list
+            # of strings is kept alive for a final join
+            full_text_buf = io.StringIO()
+            transcript_segments = list(
+                self.process_segments_streaming(segments, include_word_timestamps, full_text_buf)
+            )
+
             transcript = {
                 'language': info.language,
                 'language_probability': info.language_probability,
                 'duration': info.duration,
                 'segments': transcript_segments,
-                'full_text': ' '.join(full_text)
+                'full_text': full_text_buf.getvalue().rstrip()
             }
             
             return transcript
@@ -44,6 +53,52 @@ class SegmentProcessor:
             self.logger.error(f"Error processing segments: {str(e)}")
             raise
     
+    def process_segments_streaming(self, segments: Any, include_word_timestamps: bool = False,
+                                   full_text_buf: Optional[io.StringIO] = None) -> Iterator[Dict]:
+        """
+        Yield formatted segments as Whisper decodes them.
+
+        faster-whisper returns segments lazily; yielding here lets
+        Python post-processing overlap with the GPU decode instead of
+        waiting for the full pass to finish.
+
+        Args:
+            segments: Transcription segments from Whisper
+            include_word_timestamps: Whether to include word-level timestamps
+            full_text_buf: Optional buffer that accumulates the full text
+
+        Yields:
+            Formatted segment dictionaries
+        """
+        for segment in segments:
+            segment_data = self._process_single_segment(segment, include_word_timestamps)
+            if full_text_buf is not None:
+                full_text_buf.write(segment_data['text'])
+                full_text_buf.write(' ')
+            yield segment_data
+
+    def segments_to_soa(self, segments: List[Dict]) -> Dict[str, Any]:
+        """
+        Build a struct-of-arrays view over processed segments.
+
+        The list-of-dicts transcript stays the canonical format, but
+        vectorized consumers (candidate windows, clip slicing) want
+        contiguous float buffers rather than per-element dict lookups.
+
+        Args:
+            segments: List of segment dictionaries
+
+        Returns:
+            Dictionary with 'ids', 'starts', 'ends' arrays and 'texts' list
+        """
+        count = len(segments)
+        return {
+            'ids': np.fromiter((s['id'] for s in segments), dtype=np.int64, count=count),
+            'starts': np.fromiter((s['start'] for s in segments), dtype=np.float64, count=count),
+            'ends': np.fromiter((s['end'] for s in segments), dtype=np.float64, count=count),
+            'texts': [s['text'] for s in segments]
+        }
+
     def _process_single_segment(self, segment: Any, include_word_timestamps: bool) -> Dict:
         """
         Process a single segment.
@@ -78,18 +133,7 @@ class SegmentProcessor:
         Returns:
             List of word dictionaries
         """
-        processed_words = []
-        
-        for word in words:
-            word_data = {
-                'word': word.word,
-                'start': word.start,
-                'end': word.end,
-                'probability': word.probability
-            }
-            processed_words.append(word_data)
-        
-        return processed_words
+        return [dict(zip(_WORD_FIELDS, _WORD_GET(word))) for word in words]
     
     def filter_segments_by_time(self, segments: List[Dict], start_time: float, end_time: float) -> List[Dict]:
         """
@@ -103,21 +147,20 @@ class SegmentProcessor:
         Returns:
             Filtered list of segments
         """
-        filtered = []
-        
-        for segment in segments:
-            seg_start = segment['start']
-            seg_end = segment['end']
-            
-            # Check if segment overlaps with time range
-            if seg_end >= start_time and seg_start <= end_time:
-                # Adjust timestamps relative to start_time
-                adjusted_segment = segment.copy()
-                adjusted_segment['start'] = max(0, seg_start - start_time)
-                adjusted_segment['end'] = min(end_time - start_time, seg_end - start_time)
-                filtered.append(adjusted_segment)
-        
-        return filtered
+        # Segments are time-sorted, so binary-search the overlap window
+        # and only build adjusted dicts for segments inside it
+        lo = bisect_left([s['end'] for s in segments], start_time)
+        hi = bisect_right([s['start'] for s in segments], end_time)
+        duration = end_time - start_time
+
+        return [
+            {
+                **segment,
+                'start': max(0, segment['start'] - start_time),
+                'end': min(duration, segment['end'] - start_time)
+            }
+            for segment in segments[lo:hi]
+        ]
     
     def merge_segments(self, segments: List[Dict], max_duration: float = 5.0) -> List[Dict]:
         """
@@ -132,27 +175,28 @@ class SegmentProcessor:
         """
         if not segments:
             return []
-        
+
         merged = []
         current_segment = segments[0].copy()
-        
+        # Track the group start explicitly rather than reading it back
+        # from current_segment['start'] on every duration check
+        group_start = current_segment['start']
+
         for next_segment in segments[1:]:
-            current_duration = current_segment['end'] - current_segment['start']
-            next_duration = next_segment['end'] - current_segment['start']
-            
-            # Check if we can merge
-            if next_duration <= max_duration:
+            # Check if we can merge without exceeding max_duration
+            if next_segment['end'] - group_start <= max_duration:
                 current_segment['end'] = next_segment['end']
                 current_segment['text'] += ' ' + next_segment['text']
-                
+
                 # Merge words if available
                 if 'words' in current_segment and 'words' in next_segment:
                     current_segment['words'].extend(next_segment['words'])
             else:
                 merged.append(current_segment)
                 current_segment = next_segment.copy()
-        
+                group_start = current_segment['start']
+
         # Add last segment
         merged.append(current_segment)
-        
+
         return merged
\ No newline at end of file
@@ -23,65 +23,76 @@ class SubtitleGenerator:
             Path to generated SRT file
         """
         try:
-            output_path = os.path.join(output_dir, f"clip_{clip_index:02d}.srt")
-            
+            # One f-string instead of the os.path.join machinery; os.sep
+            # keeps the platform separator
+            output_path = f"{output_dir}{os.sep}clip_{clip_index:02d}.srt"
+
+            # Assemble the whole file in memory and write once; per-line
+            # f.write calls dominate on transcripts with many segments
+            parts = []
+            for idx, segment in enumerate(clip_segments, 1):
+                start_time = segment['start']
+                end_time = segment['end']
+                text = segment['text'].strip()
+
+                # Format timestamps
+                start_str = self._format_timestamp(start_time)
+                end_str = self._format_timestamp(end_time)
+
+                # Build SRT entry
+                parts.append(f"{idx}\n{start_str} --> {end_str}\n")
+
+                # Split long lines (max 42 chars per line)
+                for line in self._split_text(text, max_chars=42):
+                    parts.append(line)
+                    parts.append("\n")
+
+                parts.append("\n")
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                for idx, segment in enumerate(clip_segments, 1):
-                    start_time = segment['start']
-                    end_time = segment['end']
-                    text = segment['text'].strip()
-                    
-                    # Format timestamps
-                    start_str = self._format_timestamp(start_time)
-                    end_str = self._format_timestamp(end_time)
-                    
-                    # Write SRT entry
-                    f.write(f"{idx}\n")
-                    f.write(f"{start_str} --> {end_str}\n")
-                    
-                    # Split long lines (max 42 chars per line)
-                    lines = self._split_text(text, max_chars=42)
-                    for line in lines:
-                        f.write(f"{line}\n")
-                    
-                    f.write("\n")
+                f.write(''.join(parts))
             
-            self.logger.info(f"SRT file generated: {output_path}")
+            self.logger.info("SRT file generated: %s", output_path)
             return output_path
             
         except Exception as e:
-            self.logger.error(f"Error generating SRT: {str(e)}")
+            self.logger.error("Error generating SRT: %s", str(e))
             raise
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds to SRT timestamp (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        
+        # One float-to-int conversion, then pure integer divmods; the
+        # old float-mod chain was slower and drifted near boundaries
+        millis = int(seconds * 1000 + 0.5)
+        hours, millis = divmod(millis, 3600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
+
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
     
     def _split_text(self, text: str, max_chars: int = 42) -> List[str]:
         """Split text into lines with max character limit."""
         words = text.split()
         lines = []
-        current_line = []
-        current_length = 0
-        
-        for word in words:
-            word_length = len(word)
-            
-            if current_length + word_length + len(current_line) <= max_chars:
-                current_line.append(word)
-                current_length += word_length
+        # Track line length and word count as scalars and emit slices of
+        # the original words list; no per-line temp list to grow and join
+        line_start = 0
+        line_length = 0
+        line_words = 0
+
+        for i, word in enumerate(words):
+            new_length = line_length + len(word) + (1 if line_words else 0)
+
+            if new_length > max_chars and line_words:
+                lines.append(' '.join(words[line_start:i]))
+                line_start = i
+                line_length = len(word)
+                line_words = 1
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = word_length
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
+                line_length = new_length
+                line_words += 1
+
+        if line_words:
+            lines.append(' '.join(words[line_start:]))
+
         return lines
\ No newline at end of file
@@ -4,6 +4,9 @@ import os
 import json
 from typing import Dict, List, Tuple
 
+# Sentence/clause punctuation that ends a word group
+_PUNCT = frozenset('.!?,;')
+
 
 class ModernSubtitleGenerator:
     """Generates modern animated subtitles with word-by-word highlighting."""
@@ -25,6 +28,26 @@ class ModernSubtitleGenerator:
             'position': 'center',
             'animation': True
         })
+
+        # Bind the per-word-group limit once; it's read for every group
+        # and every fallback event
+        self._words_per_line = self.subtitle_config['words_per_line']
+
+        # Config colors are constant; convert them to ASS form once
+        # instead of re-slicing the same hex strings for every clip
+        self._primary_color = self._hex_to_ass_color(self.subtitle_config['text_color'])
+        self._highlight_color = self._hex_to_ass_color(self.subtitle_config['highlight_color'])
+        self._outline_color = self._hex_to_ass_color(self.subtitle_config['outline_color'])
+
+        # Pre-bake the header: font, sizes, and colors are fixed per
+        # instance, leaving only the format-dependent fields to fill in.
+        # video_format only ever takes these two values, so render both
+        # headers now and make _generate_ass_header a dict lookup
+        self._ass_header_tpl = self._build_ass_header_template()
+        self._headers = {
+            'shorts': self._ass_header_tpl.format(play_res_y=1920, alignment=2, margin_v=180),
+            'youtube': self._ass_header_tpl.format(play_res_y=1080, alignment=2, margin_v=100),
+        }
     
     def generate_animated_ass(self, clip_segments: List[Dict], output_dir: str, 
                              clip_index: int, video_format: str = 'shorts') -> str:
@@ -41,75 +64,67 @@ class ModernSubtitleGenerator:
             Path to generated ASS file
         """
         try:
-            output_path = os.path.join(output_dir, f"clip_{clip_index:02d}_{video_format}.ass")
-            
+            # One f-string instead of the os.path.join machinery; os.sep
+            # keeps the platform separator
+            output_path = f"{output_dir}{os.sep}clip_{clip_index:02d}_{video_format}.ass"
+
+            # Assemble all events in memory and write once; per-event
+            # f.write calls dominate on word-level transcripts
+            parts = [
+                self._generate_ass_header(video_format),
+                "\n[Events]\n",
+                "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n",
+            ]
+
+            for segment in clip_segments:
+                if 'words' not in segment or not segment['words']:
+                    # Fallback jika tidak ada word timestamps
+                    parts.append(self._simple_event(segment))
+                    continue
+
+                # Group words (2-3 words per line)
+                words = segment['words']
+                word_groups = self._group_words_smart(words)
+
+                for group in word_groups:
+                    parts.append(self._karaoke_event(group))
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                # Write ASS header with styles
-                f.write(self._generate_ass_header(video_format))
-                
-                # Write events section
-                f.write("\n[Events]\n")
-                f.write("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n")
-                
-                event_counter = 0
-                
-                for segment in clip_segments:
-                    if 'words' not in segment or not segment['words']:
-                        # Fallback jika tidak ada word timestamps
-                        self._write_simple_event(f, segment, event_counter)
-                        event_counter += 1
-                        continue
-                    
-                    # Group words (2-3 words per line)
-                    words = segment['words']
-                    word_groups = self._group_words_smart(words)
-                    
-                    for group in word_groups:
-                        self._write_karaoke_event(f, group, event_counter)
-                        event_counter += 1
+                f.write(''.join(parts))
             
-            self.logger.info(f"Modern ASS subtitle generated: {output_path}")
+            self.logger.info("Modern ASS subtitle generated: %s", output_path)
             return output_path
             
         except Exception as e:
-            self.logger.error(f"Error generating ASS subtitle: {str(e)}")
+            self.logger.error("Error generating ASS subtitle: %s", str(e))
             raise
     
-    def _generate_ass_header(self, video_format: str) -> str:
-        """Generate ASS header with custom styles."""
-        
-        # Position based on format
-        if video_format == 'shorts':
-            margin_v = 180  # From bottom for 9:16
-            alignment = 2   # Bottom center
-        else:
-            margin_v = 100  # From bottom for 16:9
-            alignment = 2   # Bottom center
-        
-        # Convert colors from hex to ASS format (&HAABBGGRR)
-        primary_color = self._hex_to_ass_color(self.subtitle_config['text_color'])
-        highlight_color = self._hex_to_ass_color(self.subtitle_config['highlight_color'])
-        outline_color = self._hex_to_ass_color(self.subtitle_config['outline_color'])
-        
+    def _build_ass_header_template(self) -> str:
+        """Pre-render the ASS header with only format fields left open."""
         fontsize = self.subtitle_config['fontsize']
         font = self.subtitle_config['font']
         outline = self.subtitle_config['outline_width']
-        
-        header = f"""[Script Info]
+
+        return f"""[Script Info]
 Title: AI Clipper - Modern Subtitles
 ScriptType: v4.00+
 WrapStyle: 0
 ScaledBorderAndShadow: yes
 YCbCr Matrix: TV.709
 PlayResX: 1080
-PlayResY: {'1920' if video_format == 'shorts' else '1080'}
+PlayResY: {{play_res_y}}
 
 [V4+ Styles]
 Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
-Style: Default,{font},{fontsize},{primary_color},&H000000FF,{outline_color},&H80000000,-1,0,0,0,100,100,0,0,1,{outline},2,{alignment},20,20,{margin_v},1
-Style: Karaoke,{font},{fontsize},{highlight_color},&H000000FF,{outline_color},&H80000000,-1,0,0,0,105,105,0,0,1,{outline},2,{alignment},20,20,{margin_v},1
+Style: Default,{font},{fontsize},{self._primary_color},&H000000FF,{self._outline_color},&H80000000,-1,0,0,0,100,100,0,0,1,{outline},2,{{alignment}},20,20,{{margin_v}},1
+Style: Karaoke,{font},{fontsize},{self._highlight_color},&H000000FF,{self._outline_color},&H80000000,-1,0,0,0,105,105,0,0,1,{outline},2,{{alignment}},20,20,{{margin_v}},1
 """
-        return header
+
+    def _generate_ass_header(self, video_format: str) -> str:
+        """Generate ASS header with custom styles."""
+        # Both variants were rendered in __init__; 9:16 shorts sit
+        # higher from the bottom than 16:9, both bottom-center aligned
+        return self._headers.get(video_format, self._headers['youtube'])
     
     def _group_words_smart(self, words: List[Dict]) -> List[List[Dict]]:
         """
@@ -123,30 +138,25 @@ Style: Karaoke,{font},{fontsize},{highlight_color},&H000000FF,{outline_color},&H
         """
         groups = []
         current_group = []
-        max_words = self.subtitle_config['words_per_line']
-        
+        max_words = self._words_per_line
+
+        # Strip each word once up front; the lookahead re-read every
+        # word a second time through words[i + 1]['word'].strip()
+        n = len(words)
+        stripped = [word['word'].strip() for word in words]
+        ends_punct = [bool(text) and text[-1] in _PUNCT for text in stripped]
+        starts_upper = [bool(text) and text[0].isupper() for text in stripped]
+
         for i, word in enumerate(words):
             current_group.append(word)
-            word_text = word['word'].strip()
-            
-            # Check if should break
-            should_break = False
-            
-            # Break on max words
-            if len(current_group) >= max_words:
-                should_break = True
-            
-            # Break on punctuation if group has 2+ words
-            if len(current_group) >= 2:
-                if any(p in word_text for p in ['.', '!', '?', ',', ';']):
-                    should_break = True
-            
-            # Break if next word starts with capital (new sentence)
-            if i < len(words) - 1:
-                next_word = words[i + 1]['word'].strip()
-                if next_word and next_word[0].isupper() and len(current_group) >= 2:
-                    should_break = True
-            
+
+            # Break on max words, on trailing punctuation, or before a
+            # capitalized word (new sentence) once the group has 2+ words
+            should_break = len(current_group) >= max_words or (
+                len(current_group) >= 2
+                and (ends_punct[i] or (i + 1 < n and starts_upper[i + 1]))
+            )
+
             if should_break:
                 groups.append(current_group)
                 current_group = []
@@ -157,59 +167,54 @@ Style: Karaoke,{font},{fontsize},{highlight_color},&H000000FF,{outline_color},&H
         
         return groups
     
-    def _write_karaoke_event(self, f, word_group: List[Dict], index: int):
+    def _karaoke_event(self, word_group: List[Dict]) -> str:
         """
-        Write karaoke-style event (word-by-word highlighting).
-        
+        Build karaoke-style event line (word-by-word highlighting).
+
         The magic: \\k<duration> creates word-by-word animation!
         """
         start_time = self._format_ass_time(word_group[0]['start'])
         end_time = self._format_ass_time(word_group[-1]['end'])
-        
-        # Build karaoke text
-        karaoke_parts = []
-        
-        for word in word_group:
-            word_text = word['word'].strip()
-            
-            # Calculate duration in centiseconds (1 cs = 10 ms)
-            duration_cs = int((word['end'] - word['start']) * 100)
-            
-            # Add karaoke tag: when this word plays, it gets highlighted
-            # \\k<duration> = karaoke effect
-            karaoke_parts.append(f"{{\\k{duration_cs}}}{word_text}")
-        
-        # Join words
-        text = " ".join(karaoke_parts)
-        
-        # Write dialogue with karaoke style
-        f.write(f"Dialogue: 0,{start_time},{end_time},Karaoke,,0,0,0,,{text}\n")
-    
-    def _write_simple_event(self, f, segment: Dict, index: int):
+
+        # Build karaoke text: \k<duration> (in centiseconds) highlights
+        # each word as it plays. %-formatting stays on the C printf path
+        # instead of parsing an f-string per word
+        text = " ".join(
+            "{\\k%d}%s" % (int((word['end'] - word['start']) * 100), word['word'].strip())
+            for word in word_group
+        )
+
+        # Dialogue with karaoke style
+        return f"Dialogue: 0,{start_time},{end_time},Karaoke,,0,0,0,,{text}\n"
+
+    def _simple_event(self, segment: Dict) -> str:
         """Fallback for segments without word timestamps."""
         start_time = self._format_ass_time(segment['start'])
         end_time = self._format_ass_time(segment['end'])
         text = segment['text'].strip()
-        
+
         # Split into multiple lines if too long
         words = text.split()
-        max_words = self.subtitle_config['words_per_line']
-        
+        max_words = self._words_per_line
+
         if len(words) <= max_words:
-            f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n")
-        else:
-            # Split into chunks
-            for i in range(0, len(words), max_words):
-                chunk = " ".join(words[i:i+max_words])
-                f.write(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{chunk}\n")
+            return f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}\n"
+
+        # Split into chunks
+        return ''.join(
+            f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{' '.join(words[i:i + max_words])}\n"
+            for i in range(0, len(words), max_words)
+        )
     
     def _format_ass_time(self, seconds: float) -> str:
         """Format seconds to ASS timestamp (H:MM:SS.CC)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        centisecs = int((seconds % 1) * 100)
-        
+        # One float-to-int conversion, then pure integer divmods; the
+        # old float-mod chain was slower and drifted near boundaries
+        centisecs = int(seconds * 100 + 0.5)
+        hours, centisecs = divmod(centisecs, 360_000)
+        minutes, centisecs = divmod(centisecs, 6_000)
+        secs, centisecs = divmod(centisecs, 100)
+
         return f"{hours}:{minutes:02d}:{secs:02d}.{centisecs:02d}"
     
     def _hex_to_ass_color(self, hex_color: str) -> str:
@@ -244,41 +249,41 @@ Style: Karaoke,{font},{fontsize},{highlight_color},&H000000FF,{outline_color},&H
             Path to SRT file
         """
         try:
-            output_path = os.path.join(output_dir, f"clip_{clip_index:02d}_simple.srt")
-            
+            output_path = f"{output_dir}{os.sep}clip_{clip_index:02d}_simple.srt"
+
+            parts = []
+            subtitle_index = 1
+
+            for segment in clip_segments:
+                if 'words' not in segment or not segment['words']:
+                    continue
+
+                words = segment['words']
+                word_groups = self._group_words_smart(words)
+
+                for group in word_groups:
+                    start_time = self._format_srt_time(group[0]['start'])
+                    end_time = self._format_srt_time(group[-1]['end'])
+                    text = " ".join(w['word'].strip() for w in group)
+
+                    parts.append(f"{subtitle_index}\n{start_time} --> {end_time}\n{text}\n\n")
+                    subtitle_index += 1
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                subtitle_index = 1
-                
-                for segment in clip_segments:
-                    if 'words' not in segment or not segment['words']:
-                        continue
-                    
-                    words = segment['words']
-                    word_groups = self._group_words_smart(words)
-                    
-                    for group in word_groups:
-                        start_time = self._format_srt_time(group[0]['start'])
-                        end_time = self._format_srt_time(group[-1]['end'])
-                        text = " ".join([w['word'].strip() for w in group])
-                        
-                        f.write(f"{subtitle_index}\n")
-                        f.write(f"{start_time} --> {end_time}\n")
-                        f.write(f"{text}\n\n")
-                        
-                        subtitle_index += 1
+                f.write(''.join(parts))
             
-            self.logger.info(f"Simple SRT subtitle generated: {output_path}")
+            self.logger.info("Simple SRT subtitle generated: %s", output_path)
             return output_path
             
         except Exception as e:
-            self.logger.error(f"Error generating SRT: {str(e)}")
+            self.logger.error("Error generating SRT: %s", str(e))
             raise
     
     def _format_srt_time(self, seconds: float) -> str:
         """Format seconds to SRT timestamp (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        
+        millis = int(seconds * 1000 + 0.5)
+        hours, millis = divmod(millis, 3600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
+
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
\ No newline at end of file
@@ -1,10 +1,22 @@
 # File: modules/transcriber.py
 
+import io
 import os
 import json
 from typing import Dict, List, Optional
 from faster_whisper import WhisperModel
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    # Older faster-whisper without batched decoding
+    BatchedInferencePipeline = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .device_manager import DeviceManager
 from .model_loader import ModelLoader
 from .segment_processor import SegmentProcessor
@@ -42,11 +54,21 @@ class Transcriber:
             
             # Load model with validated device
             self.model = self.model_loader.load_model(device)
-            
+
+            # Batched decoding chunks the audio and decodes segments in
+            # parallel — the single biggest wall-time lever in the pipeline
+            self.batched_model = None
+            if BatchedInferencePipeline is not None:
+                try:
+                    self.batched_model = BatchedInferencePipeline(model=self.model)
+                    self.logger.info("Batched inference pipeline enabled")
+                except Exception as e:
+                    self.logger.warning("Could not enable batched inference: %s", str(e))
+
             self.logger.info("Whisper model loaded successfully")
             
         except Exception as e:
-            self.logger.error(f"Error loading Whisper model: {str(e)}")
+            self.logger.error("Error loading Whisper model: %s", str(e))
             raise
     
     def transcribe(self, audio_path: str) -> Dict:
@@ -60,38 +82,13 @@ class Transcriber:
             Dictionary with full transcript and segments
         """
         try:
-            self.logger.info(f"Starting transcription for: {audio_path}")
+            self.logger.info("Starting transcription for: %s", audio_path)
             
             # Validate audio file
             self.file_handler.validate_audio_file(audio_path)
             
-            model_config = self.config['transcription']
-            
-            # FIXED VAD parameters - only use supported ones
-            vad_params = {
-                'threshold': 0.5,
-                'min_speech_duration_ms': 250,
-                'max_speech_duration_s': float('inf'),
-                'min_silence_duration_ms': 2000,
-                'speech_pad_ms': 400,
-            }
-            
-            # IMPROVED SETTINGS for better accuracy
-            segments, info = self.model.transcribe(
-                audio_path,
-                beam_size=model_config.get('beam_size', 5),
-                best_of=5,  # Generate 5 candidates, pick best
-                temperature=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],  # Multiple temperatures
-                language=model_config['language'] if model_config['language'] != 'auto' else None,
-                word_timestamps=True,  # ALWAYS enable for better subtitles
-                vad_filter=True,  # Remove silence
-                vad_parameters=vad_params,
-                condition_on_previous_text=True,  # Use context
-                compression_ratio_threshold=2.4,
-                log_prob_threshold=-1.0,
-                no_speech_threshold=0.6,
-            )
-            
+            segments, info = self._run_model(audio_path)
+
             # Process segments
             transcript = self.segment_processor.process_segments(
                 segments, 
@@ -99,22 +96,131 @@ class Transcriber:
                 include_word_timestamps=True
             )
             
-            self.logger.info(f"Transcription complete: {len(transcript['segments'])} segments")
-            self.logger.info(f"Detected language: {info.language} (prob: {info.language_probability:.2f})")
+            self.logger.info("Transcription complete: %d segments", len(transcript['segments']))
+            self.logger.info("Detected language: %s (prob: %.2f)", info.language, info.language_probability)
             
             return transcript
             
         except Exception as e:
-            self.logger.error(f"Error during transcription: {str(e)}")
+            self.logger.error("Error during transcription: %s", str(e))
             raise
     
+    def _run_model(self, audio_path: str):
+        """Run the Whisper model with the tuned decode settings."""
+        model_config = self.config['transcription']
+
+        # FIXED VAD parameters - only use supported ones
+        vad_params = {
+            'threshold': 0.5,
+            'min_speech_duration_ms': 250,
+            'max_speech_duration_s': float('inf'),
+            'min_silence_duration_ms': 2000,
+            'speech_pad_ms': 400,
+        }
+
+        # IMPROVED SETTINGS for better accuracy
+        decode_kwargs = dict(
+            beam_size=model_config.get('beam_size', 5),
+            best_of=5,  # Generate 5 candidates, pick best
+            temperature=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],  # Multiple temperatures
+            language=model_config['language'] if model_config['language'] != 'auto' else None,
+            word_timestamps=True,  # ALWAYS enable for better subtitles
+            vad_filter=True,  # Remove silence
+            vad_parameters=vad_params,
+            condition_on_previous_text=True,  # Use context
+            compression_ratio_threshold=2.4,
+            log_prob_threshold=-1.0,
+            no_speech_threshold=0.6,
+        )
+
+        if self.batched_model is not None:
+            try:
+                return self.batched_model.transcribe(
+                    audio_path,
+                    batch_size=model_config.get('batch_size', 16),
+                    **decode_kwargs
+                )
+            except TypeError as e:
+                # Installed pipeline doesn't accept these decode settings
+                self.logger.warning("Batched transcribe unavailable (%s), using sequential decode", str(e))
+                self.batched_model = None
+
+        return self.model.transcribe(audio_path, **decode_kwargs)
+
+    def transcribe_streaming(self, audio_path: str, out_path: str) -> Dict:
+        """
+        Transcribe audio, streaming segments to a JSONL file.
+
+        Keeps memory bounded for hour-long audio: each segment is
+        written as one JSON line the moment Whisper decodes it instead
+        of materializing the whole word-timestamped transcript in RAM.
+
+        Args:
+            audio_path: Path to audio file
+            out_path: Path for the segment JSONL file
+
+        Returns:
+            Summary dictionary with language info, full text, segment
+            count, and the JSONL path (no in-memory segment list)
+        """
+        try:
+            self.logger.info("Starting streaming transcription for: %s", audio_path)
+
+            self.file_handler.validate_audio_file(audio_path)
+
+            segments, info = self._run_model(audio_path)
+
+            os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+            full_text_buf = io.StringIO()
+            num_segments = 0
+
+            with open(out_path, 'wb', buffering=1 << 20) as f:
+                for segment_data in self.segment_processor.process_segments_streaming(
+                    segments, include_word_timestamps=True, full_text_buf=full_text_buf
+                ):
+                    if orjson is not None:
+                        f.write(orjson.dumps(segment_data))
+                    else:
+                        f.write(json.dumps(segment_data, ensure_ascii=False).encode('utf-8'))
+                    f.write(b'\n')
+                    num_segments += 1
+
+            self.logger.info("Transcription complete: %d segments -> %s", num_segments, out_path)
+            self.logger.info("Detected language: %s (prob: %.2f)", info.language, info.language_probability)
+
+            return {
+                'language': info.language,
+                'language_probability': info.language_probability,
+                'duration': info.duration,
+                'segments_path': out_path,
+                'num_segments': num_segments,
+                'full_text': full_text_buf.getvalue().rstrip()
+            }
+
+        except Exception as e:
+            self.logger.error("Error during streaming transcription: %s", str(e))
+            raise
+
     def save_transcript(self, transcript: Dict, output_path: str):
-        """Save transcript to JSON file."""
+        """Save transcript; .msgpack paths use binary encoding, else JSON."""
+        try:
+            if output_path.endswith('.msgpack'):
+                self.file_handler.save_msgpack(transcript, output_path)
+            else:
+                self.file_handler.save_json(transcript, output_path)
+            self.logger.info("Transcript saved to: %s", output_path)
+        except Exception as e:
+            self.logger.error("Error saving transcript: %s", str(e))
+            raise
+
+    def load_transcript(self, input_path: str) -> Dict:
+        """Load a transcript saved by save_transcript."""
         try:
-            self.file_handler.save_json(transcript, output_path)
-            self.logger.info(f"Transcript saved to: {output_path}")
+            if input_path.endswith('.msgpack'):
+                return self.file_handler.load_msgpack(input_path)
+            return self.file_handler.load_json(input_path)
         except Exception as e:
-            self.logger.error(f"Error saving transcript: {str(e)}")
+            self.logger.error("Error loading transcript: %s", str(e))
             raise
     
     def transcribe_and_save(self, audio_path: str, output_path: str) -> Dict:
@@ -1,6 +1,11 @@
 import json
 from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Uploader:
     """Prepares upload configurations for social media platforms."""
@@ -30,29 +35,35 @@ class Uploader:
                     'platforms': {}
                 }
 
+                # The hashtag list is shared by every platform; derive
+                # the joined and de-hashed forms once per clip
+                hashtags = clip['content']['hashtags']
+                hashtag_str = ' '.join(hashtags)
+                clean_tags = [tag.replace('#', '') for tag in hashtags]
+
                 # YouTube
                 if self.config['upload']['youtube']['enabled']:
-                    platform_config['platforms']['youtube'] = self._prepare_youtube(clip)
+                    platform_config['platforms']['youtube'] = self._prepare_youtube(clip, clean_tags)
 
                 # TikTok
                 if self.config['upload']['tiktok']['enabled']:
-                    platform_config['platforms']['tiktok'] = self._prepare_tiktok(clip)
+                    platform_config['platforms']['tiktok'] = self._prepare_tiktok(clip, hashtag_str)
 
                 # Instagram
                 if self.config['upload']['instagram']['enabled']:
-                    platform_config['platforms']['instagram'] = self._prepare_instagram(clip)
+                    platform_config['platforms']['instagram'] = self._prepare_instagram(clip, hashtag_str)
 
                 upload_configs.append(platform_config)
 
             return upload_configs
 
         except Exception as e:
-            self.logger.error(f"Error preparing uploads: {str(e)}")
+            self.logger.error("Error preparing uploads: %s", str(e))
             raise
 
     # ======================== PLATFORM PREPARATION ========================
 
-    def _prepare_youtube(self, clip: Dict) -> Dict:
+    def _prepare_youtube(self, clip: Dict, clean_tags: List[str]) -> Dict:
         """Prepare YouTube upload configuration."""
 
         content = clip['content']
@@ -62,14 +73,14 @@ class Uploader:
             'video_file': video_path,
             'title': content['title'],
             'description': content['description'],
-            'tags': [tag.replace('#', '') for tag in content['hashtags']],
+            'tags': clean_tags,
             'category_id': self.config['upload']['youtube']['category_id'],
             'privacy_status': self.config['upload']['youtube']['privacy'],
             'api_endpoint': 'https://www.googleapis.com/upload/youtube/v3/videos',
             'instructions': self._youtube_instructions()
         }
 
-    def _prepare_tiktok(self, clip: Dict) -> Dict:
+    def _prepare_tiktok(self, clip: Dict, hashtag_str: str) -> Dict:
         """Prepare TikTok upload configuration."""
 
         content = clip['content']
@@ -77,13 +88,13 @@ class Uploader:
 
         return {
             'video_file': video_path,
-            'caption': f"{content['caption']} {' '.join(content['hashtags'])}",
+            'caption': f"{content['caption']} {hashtag_str}",
             'privacy_level': self.config['upload']['tiktok']['privacy'],
             'api_endpoint': 'https://open-api.tiktok.com/share/video/upload/',
             'instructions': self._tiktok_instructions()
         }
 
-    def _prepare_instagram(self, clip: Dict) -> Dict:
+    def _prepare_instagram(self, clip: Dict, hashtag_str: str) -> Dict:
         """Prepare Instagram upload configuration."""
 
         content = clip['content']
@@ -91,7 +102,7 @@ class Uploader:
 
         return {
             'video_file': video_path,
-            'caption': f"{content['caption']} {' '.join(content['hashtags'])}",
+            'caption': f"{content['caption']} {hashtag_str}",
             'location_id': self.config['upload']['instagram']['location_id'],
             'api_endpoint': 'https://graph.facebook.com/v18.0/me/media',
             'instructions': self._instagram_instructions()
@@ -102,10 +113,14 @@ class Uploader:
     def save_upload_configs(self, configs: List[Dict], output_path: str):
         """Save upload configurations to JSON file."""
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(configs, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(configs, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(configs, f, indent=2, ensure_ascii=False)
 
-        self.logger.info(f"✅ Upload configurations saved: {output_path}")
+        self.logger.info("✅ Upload configurations saved: %s", output_path)
 
     # ======================== INSTRUCTIONS ========================
 
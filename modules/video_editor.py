@@ -1,8 +1,24 @@
 import os
+import shutil
+import subprocess
 import ffmpeg
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 from pathlib import Path
 from typing import Dict, List
 
+from .video_processor import probe_media
+
+# Color-name to hex mapping for ffmpeg subtitle styling
+_COLOR_HEX = {
+    'white': 'FFFFFF',
+    'black': '000000',
+    'yellow': 'FFFF00',
+    'red': 'FF0000',
+    'blue': '0000FF'
+}
+
 
 class VideoEditor:
     """Handles video editing operations."""
@@ -10,7 +26,66 @@ class VideoEditor:
     def __init__(self, config: Dict, logger):
         self.config = config
         self.logger = logger
-    
+        self.use_gpu = (
+            config['video_editing'].get('gpu_acceleration', True)
+            and self._detect_gpu()
+        )
+        if self.use_gpu:
+            self.logger.info("GPU detected, using NVDEC/NVENC for video encoding")
+        # CPU-encode fallback speed knob; NVENC has its own preset grid
+        self._x264_preset = config['video_editing'].get('x264_preset', 'medium')
+        self._probe_cache = {}
+        self._probe_lock = threading.Lock()
+
+    def _probe_video(self, input_path: str) -> Dict:
+        """Probe the video stream of a file, caching per path.
+
+        Every clip and format variant reads the same source, so the
+        container is parsed by ffprobe once instead of N clips x M
+        formats times. The underlying probe is shared with
+        VideoProcessor via the stat-keyed probe_media cache.
+        """
+        with self._probe_lock:
+            info = self._probe_cache.get(input_path)
+            if info is None:
+                probe = probe_media(input_path)
+                info = next(
+                    s for s in probe['streams'] if s['codec_type'] == 'video'
+                )
+                self._probe_cache[input_path] = info
+        return info
+
+    def _probe_audio(self, input_path: str) -> Dict:
+        """Probe the audio stream of a file (None if there isn't one).
+
+        Same stat-keyed probe as _probe_video, so asking for both
+        streams still costs a single ffprobe run per source.
+        """
+        probe = probe_media(input_path)
+        return next(
+            (s for s in probe['streams'] if s['codec_type'] == 'audio'), None
+        )
+
+    def _detect_gpu(self) -> bool:
+        """Check once whether CUDA and an NVENC-capable ffmpeg are available."""
+        try:
+            from utils.device import CUDA_OK
+            if not CUDA_OK:
+                return False
+        except Exception:
+            return False
+
+        # A CUDA GPU alone isn't enough: the ffmpeg build must also
+        # ship the encoder, and distro builds frequently don't
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-encoders'],
+                capture_output=True, text=True, timeout=15
+            )
+            return 'h264_nvenc' in result.stdout
+        except Exception:
+            return False
+
     def cut_clip(self, video_path: str, start_time: float, end_time: float,
                  output_dir: str, clip_index: int) -> Dict[str, str]:
         """
@@ -30,53 +105,175 @@ class VideoEditor:
             self.logger.info(f"Cutting clip {clip_index}: {start_time:.1f}s - {end_time:.1f}s")
             
             duration = end_time - start_time
-            clip_paths = {}
-            
-            # Create each output format separately
-            for format_config in self.config['video_editing']['output_formats']:
+            formats = self.config['video_editing']['output_formats']
+
+            def render_format(format_config: Dict) -> tuple:
                 format_name = format_config['name']
-                width = format_config['width']
-                height = format_config['height']
-                
                 output_filename = f"clip_{clip_index:02d}_{format_name}_raw.mp4"
                 output_path = os.path.join(output_dir, output_filename)
-                
-                # Cut and resize (each format separately)
+
                 self._cut_and_resize(
-                    video_path, 
-                    start_time, 
-                    duration, 
+                    video_path,
+                    start_time,
+                    duration,
                     output_path,
-                    width, 
-                    height
+                    format_config['width'],
+                    format_config['height']
                 )
-                
-                clip_paths[format_name] = output_path
-                self.logger.info(f"Created {format_name} version: {output_path}")
-            
+                return format_name, output_path
+
+            # Formats sharing the same dimensions would produce
+            # identical encodes (no subtitles differ here); encode each
+            # distinct size once and hardlink the rest
+            primary = {}
+            aliases = []
+            for format_config in formats:
+                key = (format_config['width'], format_config['height'])
+                if key in primary:
+                    aliases.append((format_config['name'], key))
+                else:
+                    primary[key] = format_config
+
+            # ffmpeg runs as a subprocess, so the format variants encode
+            # concurrently without fighting the GIL (same pattern as
+            # cut_and_burn)
+            clip_paths = {}
+            with ThreadPoolExecutor(max_workers=len(primary)) as pool:
+                for format_name, output_path in pool.map(render_format, primary.values()):
+                    clip_paths[format_name] = output_path
+                    self.logger.info(f"Created {format_name} version: {output_path}")
+
+            for format_name, key in aliases:
+                source = clip_paths[primary[key]['name']]
+                alias_path = os.path.join(
+                    output_dir, f"clip_{clip_index:02d}_{format_name}_raw.mp4"
+                )
+                if os.path.exists(alias_path):
+                    os.remove(alias_path)
+                try:
+                    os.link(source, alias_path)
+                except OSError:
+                    # Filesystem without hardlinks (FAT, cross-device)
+                    shutil.copyfile(source, alias_path)
+                clip_paths[format_name] = alias_path
+                self.logger.info(f"Created {format_name} version (shared encode): {alias_path}")
+
             return clip_paths
             
         except Exception as e:
             self.logger.error(f"Error cutting clip: {str(e)}")
             raise
     
+    def cut_and_burn(self, video_path: str, start_time: float, end_time: float,
+                     subtitle_paths: Dict[str, str], output_dir: str,
+                     clip_index: int) -> Dict[str, str]:
+        """
+        Cut, resize, and burn ASS subtitles in a single ffmpeg pass per format.
+
+        Fusing the cut and the subtitle burn avoids a second full
+        decode/encode cycle per clip per format.
+
+        Args:
+            video_path: Input video path
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            subtitle_paths: Mapping of format name to ASS subtitle path
+            output_dir: Output directory
+            clip_index: Clip number
+
+        Returns:
+            Dictionary mapping format names to final output paths
+        """
+        try:
+            self.logger.info(
+                f"Cutting+burning clip {clip_index}: {start_time:.1f}s - {end_time:.1f}s"
+            )
+
+            duration = end_time - start_time
+            formats = self.config['video_editing']['output_formats']
+
+            def render_format(format_config: Dict) -> tuple:
+                format_name = format_config['name']
+                output_filename = f"clip_{clip_index:02d}_{format_name}_final.mp4"
+                output_path = os.path.join(output_dir, output_filename)
+
+                self._cut_and_resize(
+                    video_path,
+                    start_time,
+                    duration,
+                    output_path,
+                    format_config['width'],
+                    format_config['height'],
+                    ass_path=subtitle_paths.get(format_name)
+                )
+                return format_name, output_path
+
+            # ffmpeg runs as a subprocess, so format variants of the same
+            # cut can encode concurrently without fighting the GIL
+            final_paths = {}
+            with ThreadPoolExecutor(max_workers=len(formats)) as pool:
+                for format_name, output_path in pool.map(render_format, formats):
+                    final_paths[format_name] = output_path
+                    self.logger.info(f"Created {format_name} version: {output_path}")
+
+            return final_paths
+
+        except Exception as e:
+            self.logger.error(f"Error cutting+burning clip: {str(e)}")
+            raise
+
     def _cut_and_resize(self, input_path: str, start_time: float, duration: float,
-                       output_path: str, target_width: int, target_height: int):
-        """Cut and resize video using ffmpeg."""
+                       output_path: str, target_width: int, target_height: int,
+                       ass_path: str = None):
+        """Cut and resize video using ffmpeg (optionally burning subtitles)."""
         try:
-            # Get input video dimensions
-            probe = ffmpeg.probe(input_path)
-            video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
+            # Get input video dimensions (cached per source path)
+            video_info = self._probe_video(input_path)
             input_width = int(video_info['width'])
             input_height = int(video_info['height'])
             
             # Calculate aspect ratios
             input_ratio = input_width / input_height
             target_ratio = target_width / target_height
-            
-            # Build ffmpeg command
-            input_stream = ffmpeg.input(input_path, ss=start_time, t=duration)
-            
+
+            input_fps = float(Fraction(video_info['r_frame_rate']))
+
+            # Fast path: when the output needs no filtering at all
+            # (matching dimensions and frame rate, no subtitle burn, no
+            # loudnorm), stream-copy the cut instead of re-encoding.
+            # Input-side seeking snaps the start to the previous
+            # keyframe, trading up to one GOP of slack for a
+            # near-I/O-bound cut. Copying also requires mp4-muxable
+            # source codecs: mkv/webm inputs can carry vp8/vorbis,
+            # which the .mp4 output can't take unre-encoded
+            audio_info = self._probe_audio(input_path)
+            copyable_codecs = (
+                video_info.get('codec_name') == 'h264'
+                and (audio_info is None or audio_info.get('codec_name') == 'aac')
+            )
+            needs_filters = (
+                ass_path
+                or not copyable_codecs
+                or input_width != target_width
+                or input_height != target_height
+                or abs(input_fps - 30) > 0.01
+                or self.config['video_editing'].get('audio_normalization', False)
+            )
+            if not needs_filters:
+                stream = ffmpeg.input(input_path, ss=start_time, t=duration)
+                output = ffmpeg.output(stream, output_path, vcodec='copy', acodec='copy')
+                ffmpeg.run(output, overwrite_output=True, quiet=True)
+                return
+
+            # Build ffmpeg command (NVDEC decode when the GPU is available;
+            # filters still run on the CPU, so frames stay in system memory)
+            if self.use_gpu:
+                input_stream = ffmpeg.input(
+                    input_path, ss=start_time, t=duration, hwaccel='cuda'
+                )
+            else:
+                input_stream = ffmpeg.input(input_path, ss=start_time, t=duration)
+
             # Scale and crop logic
             if abs(input_ratio - target_ratio) < 0.01:
                 # Same ratio, just scale
@@ -100,31 +297,70 @@ class VideoEditor:
                 video = video.filter('scale', scale_width, scale_height)
                 video = video.filter('crop', target_width, target_height, 0, crop_y)
             
-            # Set FPS
-            video = video.filter('fps', fps=30)
-            
+            # Force 30 fps only when the source differs; for an
+            # already-30fps input the filter would re-time every frame
+            # for nothing
+            if abs(input_fps - 30) > 0.01:
+                video = video.filter('fps', fps=30)
+
+            # Burn subtitles in the same pass when requested
+            if ass_path:
+                video = video.filter('ass', self._escape_filter_path(ass_path))
+
             # Handle audio
             audio = input_stream.audio
-            
-            # Audio normalization if enabled
+
+            # Audio normalization if enabled; without it, an AAC source
+            # can be stream-copied instead of decoded and re-encoded
+            acodec = 'aac'
             if self.config['video_editing'].get('audio_normalization', False):
                 target_level = self.config['video_editing'].get('target_audio_level', -16)
                 audio = audio.filter('loudnorm', I=target_level, TP=-1.5, LRA=11)
-            
-            # Output
-            output = ffmpeg.output(
-                video, 
-                audio, 
-                output_path,
-                vcodec='libx264',
-                acodec='aac',
-                preset='medium',
-                crf=23
-            )
-            
+            else:
+                audio_info = self._probe_audio(input_path)
+                if audio_info is not None and audio_info.get('codec_name') == 'aac':
+                    acodec = 'copy'
+
+            # Output (NVENC when available: 3-8x faster H.264 encode)
+            if self.use_gpu:
+                output = ffmpeg.output(
+                    video,
+                    audio,
+                    output_path,
+                    vcodec='h264_nvenc',
+                    acodec=acodec,
+                    preset='p4',
+                    tune='hq',
+                    video_bitrate='6M'
+                )
+            else:
+                output = ffmpeg.output(
+                    video,
+                    audio,
+                    output_path,
+                    vcodec='libx264',
+                    acodec=acodec,
+                    preset=self._x264_preset,
+                    crf=23
+                )
+
             # Run
             ffmpeg.run(output, overwrite_output=True, quiet=True)
-            
+
+        except ffmpeg.Error as e:
+            # Passing the -encoders probe doesn't guarantee a working
+            # NVENC session (driver mismatch, session limits); drop to
+            # the CPU path permanently on the first failure
+            if self.use_gpu:
+                self.logger.warning("GPU encode failed, falling back to CPU encoding")
+                self.use_gpu = False
+                self._cut_and_resize(
+                    input_path, start_time, duration, output_path,
+                    target_width, target_height, ass_path=ass_path
+                )
+                return
+            self.logger.error(f"Error in cut_and_resize: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error in cut_and_resize: {str(e)}")
             raise
@@ -145,36 +381,57 @@ class VideoEditor:
             
             self.logger.info(f"Burning ASS subtitles: {ass_path}")
             
-            # Fix path for Windows (escape special characters)
-            ass_path_escaped = ass_path.replace('\\', '/').replace(':', '\\:')
-            
+            ass_path_escaped = self._escape_filter_path(ass_path)
+
             # Build ffmpeg command
-            input_stream = ffmpeg.input(video_path)
-            
+            if self.use_gpu:
+                input_stream = ffmpeg.input(video_path, hwaccel='cuda')
+            else:
+                input_stream = ffmpeg.input(video_path)
+
             # Apply ASS subtitle filter
             # ass filter supports full ASS styling and animations
             video = input_stream.video.filter('ass', ass_path_escaped)
-            
+
             # Copy audio
             audio = input_stream.audio
-            
+
             # Output
-            output = ffmpeg.output(
-                video,
-                audio,
-                output_path,
-                vcodec='libx264',
-                acodec='aac',
-                preset='medium',
-                crf=23
-            )
+            if self.use_gpu:
+                output = ffmpeg.output(
+                    video,
+                    audio,
+                    output_path,
+                    vcodec='h264_nvenc',
+                    acodec='aac',
+                    preset='p4',
+                    tune='hq',
+                    video_bitrate='6M'
+                )
+            else:
+                output = ffmpeg.output(
+                    video,
+                    audio,
+                    output_path,
+                    vcodec='libx264',
+                    acodec='aac',
+                    preset=self._x264_preset,
+                    crf=23
+                )
             
             # Run
             ffmpeg.run(output, overwrite_output=True, quiet=True)
             
             self.logger.info(f"ASS subtitles burned: {output_path}")
             return output_path
-            
+
+        except ffmpeg.Error as e:
+            if self.use_gpu:
+                self.logger.warning("GPU encode failed, falling back to CPU encoding")
+                self.use_gpu = False
+                return self.burn_subtitles_ass(video_path, ass_path, format_name)
+            self.logger.error(f"Error burning ASS subtitles: {str(e)}")
+            raise
         except Exception as e:
             self.logger.error(f"Error burning ASS subtitles: {str(e)}")
             raise
@@ -198,8 +455,7 @@ class VideoEditor:
             # Get subtitle style config
             style = self.config['video_editing']['subtitle_style']
             
-            # Fix path for Windows (escape backslashes and colons)
-            srt_path_escaped = srt_path.replace('\\', '/').replace(':', '\\\\:')
+            srt_path_escaped = self._escape_filter_path(srt_path)
             
             # Build subtitle filter with style
             subtitle_style = (
@@ -232,7 +488,7 @@ class VideoEditor:
                 output_path,
                 vcodec='libx264',
                 acodec='copy',
-                preset='medium'
+                preset=self._x264_preset
             )
             
             # Run
@@ -245,13 +501,21 @@ class VideoEditor:
             self.logger.error(f"Error burning subtitles: {str(e)}")
             raise
     
-    def _color_to_hex(self, color: str) -> str:
+    @staticmethod
+    def _escape_filter_path(path: str) -> str:
+        """Escape a filename for use inside an ffmpeg filter argument.
+
+        Filter arguments sit under two quoting layers (the argument and
+        the filtergraph), so quotes, colons, and the graph separators
+        all need escaping — the old per-site replace() chains only
+        handled colons, and inconsistently at that.
+        """
+        path = path.replace('\\', '/')
+        for ch in "':,;[]":
+            path = path.replace(ch, '\\' + ch)
+        return path
+
+    @staticmethod
+    def _color_to_hex(color: str) -> str:
         """Convert color name to hex for ffmpeg."""
-        colors = {
-            'white': 'FFFFFF',
-            'black': '000000',
-            'yellow': 'FFFF00',
-            'red': 'FF0000',
-            'blue': '0000FF'
-        }
-        return colors.get(color.lower(), 'FFFFFF')
\ No newline at end of file
+        return _COLOR_HEX.get(color.lower(), 'FFFFFF')
\ No newline at end of file
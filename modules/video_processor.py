@@ -2,11 +2,30 @@
 
 import os
 import subprocess
+import functools
 import ffmpeg
+from fractions import Fraction
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 
+@functools.lru_cache(maxsize=64)
+def _cached_probe(path: str, mtime_ns: int, size: int) -> Dict:
+    """Probe a media file, memoized on (path, mtime, size).
+
+    Every ffprobe call spawns a subprocess (100-300 ms); the same source
+    is probed once per clip per format without this. The stat fields key
+    the cache so an overwritten file is re-probed.
+    """
+    return ffmpeg.probe(path)
+
+
+def probe_media(path: str) -> Dict:
+    """Cached ffmpeg.probe keyed on the file's current stat."""
+    st = os.stat(path)
+    return _cached_probe(path, st.st_mtime_ns, st.st_size)
+
+
 class VideoProcessor:
     """Handles video processing operations using ffmpeg."""
     
@@ -32,14 +51,24 @@ class VideoProcessor:
             
             # Extract audio using ffmpeg
             self.logger.info(f"Extracting audio to: {audio_path}")
-            
+
+            # Whisper resamples to 16 kHz mono internally, so emit that
+            # directly unless the config asks to keep the source quality;
+            # selecting .audio also skips decoding the video stream
+            if self.config['video'].get('preserve_audio_quality', False):
+                channels = self.config['video']['audio_channels']
+                sample_rate = self.config['video']['audio_sample_rate']
+            else:
+                channels = 1
+                sample_rate = 16000
+
             stream = ffmpeg.input(video_path)
             stream = ffmpeg.output(
-                stream,
+                stream.audio,
                 audio_path,
                 acodec='pcm_s16le',
-                ac=self.config['video']['audio_channels'],
-                ar=self.config['video']['audio_sample_rate']
+                ac=channels,
+                ar=sample_rate
             )
             
             ffmpeg.run(stream, overwrite_output=True, quiet=True)
@@ -62,7 +91,7 @@ class VideoProcessor:
             Dictionary with video metadata
         """
         try:
-            probe = ffmpeg.probe(video_path)
+            probe = probe_media(video_path)
             video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
             audio_info = next((s for s in probe['streams'] if s['codec_type'] == 'audio'), None)
             
@@ -72,7 +101,9 @@ class VideoProcessor:
                 'duration': duration,
                 'width': int(video_info['width']),
                 'height': int(video_info['height']),
-                'fps': eval(video_info['r_frame_rate']),
+                # ffprobe reports rates like "30000/1001"; Fraction parses
+                # them without eval's compile step (or its injection risk)
+                'fps': float(Fraction(video_info['r_frame_rate'])),
                 'codec': video_info['codec_name'],
                 'has_audio': audio_info is not None,
                 'format': probe['format']['format_name']
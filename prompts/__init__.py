@@ -3,6 +3,7 @@
 
 __all__ = [
     'VIRALITY_PROMPT',
+    'VIRALITY_SYSTEM_PROMPT',
     'CAPTION_PROMPT',
     'TITLE_PROMPT',
     'HASHTAG_PROMPT'
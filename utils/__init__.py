@@ -1,3 +1,3 @@
 """Utilities package for AI Clipper."""
 
-__all__ = ['setup_logger', 'validate_input_video']
\ No newline at end of file
+__all__ = ['setup_logger', 'validate_input_video', 'validate_input_videos']
\ No newline at end of file
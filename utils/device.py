@@ -0,0 +1,19 @@
+# File: utils/device.py
+
+"""Shared, cached CUDA device probe.
+
+torch.cuda.is_available() involves driver probing and lazy CUDA runtime
+initialization, so it is queried once at import time and the result is
+reused everywhere instead of re-probing per call site.
+"""
+
+try:
+    import torch
+
+    CUDA_OK = torch.cuda.is_available()
+    DEVICE = torch.device('cuda' if CUDA_OK else 'cpu')
+    DEVICE_NAME = torch.cuda.get_device_name(0) if CUDA_OK else 'cpu'
+except ImportError:
+    CUDA_OK = False
+    DEVICE = 'cpu'
+    DEVICE_NAME = 'cpu'
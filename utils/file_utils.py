@@ -26,8 +26,12 @@ def get_file_size_mb(file_path: str) -> float:
 
 def list_files_by_extension(directory: str, extensions: List[str]) -> List[str]:
     """List all files with given extensions in directory."""
-    files = []
-    for ext in extensions:
-        pattern = f"*.{ext}"
-        files.extend(Path(directory).glob(pattern))
-    return [str(f) for f in files]
\ No newline at end of file
+    # One scandir pass instead of a glob (directory read) per extension
+    exts = {ext.lower().lstrip('.') for ext in extensions}
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.is_file() and '.' in entry.name
+            and entry.name.rsplit('.', 1)[-1].lower() in exts
+        ]
\ No newline at end of file
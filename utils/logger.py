@@ -20,10 +20,19 @@ class ColoredFormatter(logging.Formatter):
         'ERROR': Fore.RED,
         'CRITICAL': Fore.RED + Style.BRIGHT
     }
-    
+
+    # Level names colorized once at class creation; format() is on the
+    # path of every log record, so it becomes one dict lookup instead
+    # of a lookup plus a three-part concat per record
+    _COLORED = {
+        level: f"{color}{level}{Style.RESET_ALL}"
+        for level, color in COLORS.items()
+    }
+
     def format(self, record):
-        color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{color}{record.levelname}{Style.RESET_ALL}"
+        # An already-colorized name isn't a key, so a record formatted
+        # twice (e.g. by multiple handlers) isn't colorized twice
+        record.levelname = self._COLORED.get(record.levelname, record.levelname)
         return super().format(record)
 
 